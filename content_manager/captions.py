@@ -1,12 +1,19 @@
+import codecs
 import csv
+import os
+from collections import Counter
+from itertools import chain
 from pathlib import Path
-from typing import Dict, List, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, TextIO, Tuple
 
 from config.logging import logger
 
 from .strict_validator import StrictValidator
 
-INVALID_PRODUCT_NAMES = {"none", "null"}
+INVALID_PRODUCT_NAMES = frozenset({"none", "null"})
+EMPTY_CELL_VALUES = frozenset({"", '""'})
+UTF8_CHECK_CHUNK_SIZE = 64 * 1024
+LARGE_CAPTIONS_FILE_SIZE = 8 * 1024 * 1024  # ~100k caption rows
 
 
 class CaptionsValidator(StrictValidator):
@@ -16,6 +23,11 @@ class CaptionsValidator(StrictValidator):
         self.content_types: Set[str] = set()
         self.products: Dict[str, Set[str]] = {}
         self.validation_messages: List[Tuple[str, str]] = []
+        self._headers: Optional[List[str]] = None
+        self._is_product_col: Tuple[bool, ...] = ()
+        self._product_cols: Tuple[Tuple[int, str], ...] = ()
+        self._content_indices: Tuple[int, ...] = ()
+        self._content_types_lower: FrozenSet[str] = frozenset()
 
     def validate(
         self, file_path: Path, separator: str = ","
@@ -34,39 +46,16 @@ class CaptionsValidator(StrictValidator):
             self.raise_if_errors()
             return set(), {}
 
-        # Run all validation checks
-        checks = [
-            self._check_unquoted_empty_rows,
-            self._check_empty_rows,
-            self._check_column_count,
-            self._check_string_cells,
-            self._check_whitespace_cells,
-            self._check_empty_content_format,
-            self._check_product_cells,
-            self._populate_products,
-            self._check_product_name_not_content_type,
-            self._check_reserved_product_names,
-            self._check_unique_product_names,
-        ]
-
-        validation_passed = True
-        for check in checks:
-            result = check(file_path)
-
-            if not result:
-                # Special case: allow empty product cell warnings
-                if check == self._check_product_cells and all(
-                    "Empty product cell" in w for w in self.warnings
-                ):
-                    continue
-
-                validation_passed = False
+        # Run all row checks in a single pass over the file
+        try:
+            if not self._scan_rows(file_path):
                 if self.errors:  # If there are errors, raise them
                     self.raise_if_errors()
-                    return set(), {}
-
-        if not validation_passed:
-            return set(), {}
+                return set(), {}
+        finally:
+            self._headers = None
+            # Products are collected as sets, sort them once all rows are in
+            self.products = {ct: sorted(prods) for ct, prods in self.products.items()}
 
         return self.content_types, self.products
 
@@ -97,21 +86,24 @@ class CaptionsValidator(StrictValidator):
             logger.critical(f"Validation failed: File is empty at {file_path}")
             return False
 
-        # Check UTF-8 encoding
+        # Check UTF-8 encoding in chunks so the whole file is never held in memory
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                f.read()
+            decoder = codecs.getincrementaldecoder("utf-8")()
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(UTF8_CHECK_CHUNK_SIZE), b""):
+                    decoder.decode(chunk)
+            decoder.decode(b"", final=True)
         except UnicodeDecodeError:
             self.add_error(f"File is not UTF-8 encoded: {file_path}")
-            logger.debug(f"Validation failed: File is not UTF-8 encoded at {file_path}")
+            logger.debug("Validation failed: File is not UTF-8 encoded at %s", file_path)
             return False
 
         return True
 
     def _validate_headers(self, file_path: Path) -> bool:
         """Validate headers one check at a time"""
-        logger.debug(f"Validating headers called from: {file_path}")
-        logger.debug(f"Current separator is: {self.separator}")
+        logger.debug("Validating headers called from: %s", file_path)
+        logger.debug("Current separator is: %s", self.separator)
 
         # 1. Read header line
         try:
@@ -120,7 +112,7 @@ class CaptionsValidator(StrictValidator):
                 headers = next(reader)  # Get first line as list
 
             logger.debug(
-                f"Headers after reading with separator '{self.separator}': {headers}"
+                "Headers after reading with separator '%s': %s", self.separator, headers
             )
 
         except Exception as e:
@@ -138,35 +130,36 @@ class CaptionsValidator(StrictValidator):
             return False
 
         # 4. Check product header format - with detailed logging
-        logger.debug(f"Raw headers received: {headers}")
+        logger.debug("Raw headers received: %s", headers)
 
         for header in headers:
             # Skip non-product headers
             if not header.lower().startswith("product"):
-                logger.debug(f"Skipping non-product header: {header}")
+                logger.debug("Skipping non-product header: %s", header)
                 continue
 
-            logger.debug(f"Validating product header: {header}")
+            logger.debug("Validating product header: %s", header)
 
             # Clean and split header
             header = header.strip()
             parts = header.split("_")
-            logger.debug(f"Header parts after split: {parts}")
+            logger.debug("Header parts after split: %s", parts)
 
             if len(parts) != 2 or parts[0] != "product":
                 error_msg = (
                     f"Invalid product header format: {header}. Must be 'product_type'"
                 )
-                logger.debug(f"Validation failed: {error_msg}")
-                logger.debug(f"Split parts were: {parts}")
+                logger.debug("Validation failed: %s", error_msg)
+                logger.debug("Split parts were: %s", parts)
                 self.add_error(error_msg)
                 return False
 
-            logger.debug(f"Valid product header: {header} -> type: {parts[1]}")
+            logger.debug("Valid product header: %s -> type: %s", header, parts[1])
 
         # 5. Check content/product pairs
-        product_headers = [h for h in headers if h.startswith("product_")]
-        content_headers = [h for h in headers if not h.startswith("product_")]
+        is_product_col = tuple(h.startswith("product_") for h in headers)
+        product_headers = [h for h, is_p in zip(headers, is_product_col) if is_p]
+        content_headers = [h for h, is_p in zip(headers, is_product_col) if not is_p]
 
         for content_header in content_headers:
             if f"product_{content_header}" not in product_headers:
@@ -175,8 +168,18 @@ class CaptionsValidator(StrictValidator):
                 )
                 return False
 
-        # 6. Store valid content types
-        self.content_types = set(h for h in headers if not h.startswith("product_"))
+        # 6. Store the column layout for the row scan (which sets content types)
+        self._headers = headers
+        self._is_product_col = is_product_col
+        self._product_cols = tuple(
+            (i, h[8:])  # Get index and content type
+            for i, h in enumerate(headers)
+            if is_product_col[i]
+        )
+        self._content_indices = tuple(
+            i for i, is_p in enumerate(is_product_col) if not is_p
+        )
+        self._content_types_lower = frozenset(h.lower() for h in content_headers)
 
         return True
 
@@ -184,7 +187,7 @@ class CaptionsValidator(StrictValidator):
         """Validate data consistency across the file"""
         try:
             # Check that all content types exist in products dictionary
-            if set(self.products.keys()) != self.content_types:
+            if self.products.keys() != self.content_types:
                 self.add_error("Content types mismatch between headers and data")
                 return False
 
@@ -197,407 +200,205 @@ class CaptionsValidator(StrictValidator):
             )
             return False
 
-    def _check_empty_rows(self, file_path: Path) -> bool:
-        """Check ONLY for completely empty unquoted rows"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                next(f)  # Skip header
-                for row_num, line in enumerate(f, start=2):
-                    stripped = line.strip()
-
-                    # Case 1: Just commas (,,,)
-                    if all(c in [",", " "] for c in stripped):
-                        self.add_error(
-                            f"Row {row_num} cannot be empty (use quotes for empty cells)"
-                        )
-                        raise ValueError(
-                            f"Row {row_num} cannot be empty (use quotes for empty cells)"
-                        )
-
-                    # Case 2: Has proper empty quotes (,"",,"")
-                    if '""' in stripped:
-                        continue
-
-            return True
-
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking empty rows: {str(e)}")
-            return False
-
-    def _check_column_count(self, file_path: Path) -> bool:
-        """Check ONLY column counts"""
-        with open(file_path, "r", encoding="utf-8") as f:
-            reader = csv.reader(f, delimiter=self.separator)
-            headers = next(reader)
-            expected_columns = len(headers)
-
-            for row_num, row in enumerate(reader, start=2):
-                if len(row) != expected_columns:
-                    self.add_error(f"Row {row_num} has incorrect number of columns")
-                    return False
-        return True
-
-    def _check_string_cells(self, file_path: Path) -> bool:
-        """Check ONLY that all cells are strings and look like strings"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=self.separator)
-                next(reader)  # Skip headers
-
-                for row_num, row in enumerate(reader, start=2):
-                    for col_num, cell in enumerate(row):
-                        # Check if cell looks like a number
-                        if cell.isdigit():
-                            self.add_error(
-                                f"Cell at row {row_num}, column {col_num} is not a string"
-                            )
-                            raise ValueError(
-                                f"Cell at row {row_num}, column {col_num} is not a string"
-                            )
-
-                return True
+    def _iter_records(self, f: TextIO) -> Iterator[Tuple[int, str, List[str]]]:
+        """Yield (row_num, raw_line, row) for every data row of an open CSV file
 
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking string cells: {str(e)}")
-            return False
-
-    def _check_whitespace_cells(self, file_path: Path) -> bool:
-        """Check ONLY that cells are not unquoted whitespace-only"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=self.separator)
-                next(reader)  # Skip headers
-
-                for row_num, row in enumerate(reader, start=2):
-                    for col_num, cell in enumerate(row):
-                        # Skip empty cells
-                        if not cell:
-                            continue
-
-                        # Skip any cells that contain quotes
-                        if '"' in cell:
-                            continue
-
-                        # Now check if unquoted cell is only whitespace
-                        if cell.strip() == "":
-                            self.add_error(
-                                f"Cell at row {row_num}, column {col_num + 1} is whitespace only"
-                            )
-                            raise ValueError(
-                                f"Cell at row {row_num}, column {col_num + 1} is whitespace only"
-                            )
+        The raw text is captured alongside the parsed row so checks that care
+        about unquoted formatting can run in the same pass as the csv checks.
+        Lines without quotes are split directly; only quoted records go
+        through the csv parser, since they may span several lines.
+        """
+        separator = self.separator
+        lines = iter(f)
+        next(csv.reader(lines, delimiter=separator))  # Skip headers
+
+        raw_lines: List[str] = []
+
+        def continuation_lines() -> Iterator[str]:
+            for line in lines:
+                raw_lines.append(line)
+                yield line
+
+        continuation = continuation_lines()
+        row_num = 1
+        for line in lines:
+            row_num += 1
+
+            if '"' not in line:
+                # No quoting, so a plain split matches what csv would return
+                content = line.rstrip("\n")
+                yield row_num, line, content.split(separator) if content else []
+                continue
 
-            return True
+            raw_lines[:] = [line]
+            reader = csv.reader(chain((line,), continuation), delimiter=separator)
+            row = next(reader, [])
+            yield row_num, "".join(raw_lines), row
 
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking whitespace cells: {str(e)}")
-            return False
+    def _scan_rows(self, file_path: Path) -> bool:
+        """Run every row level check in a single pass over the file
 
-    def _check_empty_cell_quotes(self, file_path: Path) -> bool:
-        """Check ONLY that empty cells use explicit quotes ("")"""
+        Returns:
+            bool: True if valid, False if validation fails
+        """
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
-                lines = content.splitlines()
-                headers = lines[0].split(self.separator)
-
-                # Get indices for content columns (non-product)
-                content_indices = [
-                    i for i, h in enumerate(headers) if not h.startswith("product_")
-                ]
-
-                for row_num, line in enumerate(lines[1:], start=2):
-                    cells = line.split(self.separator)
-                    for idx in content_indices:  # Only check content cells
-                        # Check if content cell is empty without quotes
-                        if not cells[idx].strip() and not cells[idx].strip('"'):
-                            self.add_error(
-                                f'Empty content cell at row {row_num}, column {idx+1} must use explicit quotes ("")'
-                            )
-                            raise ValueError(
-                                f'Empty content cell at row {row_num}, column {idx+1} must use explicit quotes ("")'
-                            )
-
-            return True
-
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking empty cells: {str(e)}")
-            return False
+            if self._headers is None and not self._validate_headers(file_path):
+                return False
+            headers = self._headers
 
-    def _populate_products(self, file_path: Path) -> bool:
-        """Populate content types and products dictionary"""
-        try:
             with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=self.separator)
-                headers = next(reader)
-
-                # Initialize products dict with all content types
-                product_cols = [
-                    (i, h[8:])  # Get index and content type
-                    for i, h in enumerate(headers)
-                    if h.startswith("product_")
-                ]
+                expected_columns = len(headers)
+                product_cols = self._product_cols
 
-                # Initialize all content types with empty lists
+                # Initialize all content types with empty sets
                 self.content_types = {content_type for _, content_type in product_cols}
-                self.products = {
-                    content_type: set() for _, content_type in product_cols
-                }
-
-                # Now populate with non-empty products
-                for row in reader:
-                    for col_idx, content_type in product_cols:
-                        product = row[col_idx].strip()
-                        if product and product != '""':  # Only add non-empty products
-                            self.products[content_type].add(
-                                product
-                            )  # add() instead of append()
-
-                # Convert sets to sorted lists at the end
-                self.products = {
-                    ct: sorted(prods) for ct, prods in self.products.items()
-                }
-
-                return True
-
-        except Exception as e:
-            self.add_error(f"Unexpected error populating products: {str(e)}")
-            return False
+                self.products = {content_type: set() for _, content_type in product_cols}
 
-    def _check_product_cells(self, file_path: Path) -> bool:
-        """Check ONLY product cells for validity"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=self.separator)
-                headers = next(reader)
-
-                # Get product column indices
-                product_cols = [
-                    i for i, h in enumerate(headers) if h.startswith("product_")
-                ]
-
-                for row_num, row in enumerate(reader, start=2):
-                    for col in product_cols:
-                        cell = row[col]
-                        content_type = headers[col][8:]  # Skip 'product_' prefix
-
-                        # Empty cell checks
-                        if not cell or cell.strip() == '""':
-                            self.add_warning(
-                                f"Empty product cell at row {row_num}, column {col + 1}"
-                            )
-                            continue
-
-                        # Check for unquoted whitespace
-                        if cell.strip() == "" and not (
-                            cell.startswith('"') and cell.endswith('"')
-                        ):
-                            self.add_error(
-                                f"Product cell at row {row_num}, column {col + 1} contains unquoted whitespace"
-                            )
-                            raise ValueError(
-                                f"Product cell at row {row_num}, column {col + 1} contains unquoted whitespace"
-                            )
-
-            return True
-
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking product cells: {str(e)}")
-            return False
+                # Track seen products per type with their original case
+                seen_products = {content_type: {} for _, content_type in product_cols}
+                has_warnings = False
 
-    def _check_empty_content_format(self, file_path: Path) -> bool:
-        """Check ONLY that empty content cells use explicit quotes (\"\")"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                headers = lines[0].strip().split(self.separator)
+                check_row_not_empty = self._check_row_not_empty
+                run_row_checks = self._run_row_checks
 
-                # Get indices for content columns
-                content_indices = [
-                    i for i, h in enumerate(headers) if not h.startswith("product_")
-                ]
+                for row_num, line, row in self._iter_records(f):
+                    check_row_not_empty(row_num, line)
 
-                for row_num, line in enumerate(lines[1:], start=2):
-                    cells = line.strip().split(self.separator)
+                    if len(row) != expected_columns:
+                        self.add_error(f"Row {row_num} has incorrect number of columns")
+                        return False
 
-                    for idx in content_indices:
-                        raw_cell = cells[idx].strip()
+                    if not run_row_checks(row_num, line, row, seen_products):
+                        has_warnings = True
 
-                        # Empty cell must be exactly '""'
-                        if not raw_cell or raw_cell.strip('"') == "":
-                            if raw_cell != '""':
-                                self.add_error(
-                                    f'Empty content cell at row {row_num}, column {idx+1} must use explicit quotes ("")'
-                                )
-                                raise ValueError(
-                                    f'Empty content cell at row {row_num}, column {idx+1} must use explicit quotes ("")'
-                                )
-
-            return True
+            return not has_warnings  # Return False if we found any issues
 
         except ValueError:
             raise
         except Exception as e:
-            self.add_error(f"Unexpected error checking empty content format: {str(e)}")
+            self.add_error(f"Unexpected error checking rows: {str(e)}")
             return False
 
-    def _check_product_name_not_content_type(self, file_path: Path) -> bool:
-        """Check ONLY that product names don't match content types"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=self.separator)
-                headers = next(reader)
-
-                # Get content types and their product column indices
-                content_types = {
-                    h.lower() for h in headers if not h.startswith("product_")
-                }
-                product_indices = [
-                    (i, headers[i][8:])
-                    for i, h in enumerate(headers)
-                    if h.startswith("product_")
-                ]
-
-                for row_num, row in enumerate(reader, start=2):
-                    for idx, content_type in product_indices:
-                        product = row[idx].strip().lower()
-                        if product and product in content_types:
-                            self.add_error(
-                                f"Product name '{product}' at row {row_num}, column {idx+1} cannot match content type"
-                            )
-                            raise ValueError(
-                                f"Product name '{product}' at row {row_num}, column {idx+1} cannot match content type"
-                            )
-
-            return True
-
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking product names: {str(e)}")
-            return False
+    def _run_row_checks(
+        self,
+        row_num: int,
+        line: str,
+        row: List[str],
+        seen_products: Dict[str, Dict[str, str]],
+    ) -> bool:
+        """Run all per-cell checks on a row with the correct number of columns
 
-    def _check_reserved_product_names(self, file_path: Path) -> bool:
-        """Check ONLY that product names are not 'none' (case insensitive)"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=self.separator)
-                headers = next(reader)
+        Returns:
+            bool: False if the row produced product name warnings
+        """
+        # Cells must be strings and not unquoted whitespace-only
+        for col_num, cell in enumerate(row, start=1):
+            # Skip empty cells
+            if not cell:
+                continue
 
-                # Get product column indices
-                product_indices = [
-                    i for i, h in enumerate(headers) if h.startswith("product_")
-                ]
+            # Check if cell looks like a number
+            if cell.isdigit():
+                self.add_error(
+                    f"Cell at row {row_num}, column {col_num} is not a string"
+                )
+                raise ValueError(
+                    f"Cell at row {row_num}, column {col_num} is not a string"
+                )
 
-                for row_num, row in enumerate(reader, start=2):
-                    for idx in product_indices:
-                        product = row[idx].strip().lower()
-                        if product in INVALID_PRODUCT_NAMES:  # only checks for "none"
-                            self.add_error(
-                                f"Product name '{product}' at row {row_num}, column {idx+1} is a reserved word"
-                            )
-                            raise ValueError(
-                                f"Product name '{product}' at row {row_num}, column {idx+1} is a reserved word"
-                            )
+            # Check if unquoted cell is only whitespace
+            if cell.isspace():
+                self.add_error(
+                    f"Cell at row {row_num}, column {col_num} is whitespace only"
+                )
+                raise ValueError(
+                    f"Cell at row {row_num}, column {col_num} is whitespace only"
+                )
 
-            return True
+        # Empty content cells must be exactly '""' in the raw line
+        cells = line.strip().split(self.separator)
+        for idx in self._content_indices:
+            raw_cell = cells[idx].strip()
+            if not raw_cell or raw_cell.strip('"') == "":
+                if raw_cell != '""':
+                    self.add_error(
+                        f'Empty content cell at row {row_num}, column {idx+1} must use explicit quotes ("")'
+                    )
+                    raise ValueError(
+                        f'Empty content cell at row {row_num}, column {idx+1} must use explicit quotes ("")'
+                    )
+
+        has_warnings = False
+        content_types_lower = self._content_types_lower
+        products = self.products
+
+        for col, content_type in self._product_cols:
+            # Whitespace-only cells were rejected above, so a blank strip is empty
+            product = row[col].strip()
+
+            # Empty cell checks
+            if product in EMPTY_CELL_VALUES:
+                self.add_warning(
+                    f"Empty product cell at row {row_num}, column {col + 1}"
+                )
+                continue
 
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(
-                f"Unexpected error checking reserved product names: {str(e)}"
-            )
-            return False
+            # One lowercase key per cell, shared by every name check below
+            product_lower = product.lower()
 
-    def _check_unique_product_names(self, file_path: Path) -> bool:
-        """Check ONLY that product names don't have case variations within their type"""
-        try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                reader = csv.reader(f, delimiter=self.separator)
-                headers = next(reader)
+            # Product names can't match content types or reserved words
+            if product_lower in content_types_lower:
+                self.add_error(
+                    f"Product name '{product_lower}' at row {row_num}, column {col+1} cannot match content type"
+                )
+                raise ValueError(
+                    f"Product name '{product_lower}' at row {row_num}, column {col+1} cannot match content type"
+                )
+            if product_lower in INVALID_PRODUCT_NAMES:
+                self.add_error(
+                    f"Product name '{product_lower}' at row {row_num}, column {col+1} is a reserved word"
+                )
+                raise ValueError(
+                    f"Product name '{product_lower}' at row {row_num}, column {col+1} is a reserved word"
+                )
 
-                # Get product column indices
-                product_indices = [
-                    (i, h[8:])
-                    for i, h in enumerate(headers)
-                    if h.startswith("product_")
-                ]
+            products[content_type].add(product)
 
-                has_warnings = False  # Track if we found any issues
+            # Special handling for 'all'
+            if product_lower == "all" and product != "all":
+                self.add_warning(f"Product 'all' must be lowercase at row {row_num}")
+                has_warnings = True
+                continue
 
-                # Track seen products per type with their original case
-                seen_products = {
-                    content_type: {} for _, content_type in product_indices
-                }
+            # Remember the first spelling, only warn on a different case version
+            first_seen = seen_products[content_type].setdefault(product_lower, product)
+            if first_seen != product:
+                msg = f"Duplicate product name '{product}' at row {row_num} (previously seen as '{first_seen}')"
+                self.add_warning(msg)
+                has_warnings = True
 
-                for row_num, row in enumerate(reader, start=2):
-                    for idx, content_type in product_indices:
-                        product = row[idx].strip()
-                        if not product:  # Skip empty
-                            continue
-
-                        product_lower = product.lower()
-
-                        # Special handling for 'all'
-                        if product_lower == "all" and product != "all":
-                            msg = f"Product 'all' must be lowercase at row {row_num}"
-                            self.add_warning(msg)
-                            has_warnings = True
-                            continue
-
-                        # If we've seen this lowercase version before
-                        if product_lower in seen_products[content_type]:
-                            # Only warn if it's a different case version
-                            if product != seen_products[content_type][product_lower]:
-                                msg = f"Duplicate product name '{product}' at row {row_num} (previously seen as '{seen_products[content_type][product_lower]}')"
-                                self.add_warning(msg)
-                                has_warnings = True
-                        else:
-                            # First time seeing this product
-                            seen_products[content_type][product_lower] = product
-
-                return not has_warnings  # Return False if we found any issues
+        return not has_warnings
 
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking product name cases: {str(e)}")
-            return False
+    def _check_row_not_empty(self, row_num: int, line: str) -> None:
+        """Check that a raw row is not just separators and spaces"""
+        # Rows that open with real content can't be empty, skip the strips
+        first = line[:1]
+        if first and first != "," and not first.isspace():
+            return
 
-    def _check_unquoted_empty_rows(self, file_path: Path) -> bool:
-        """Check ONLY for rows that are just commas with no quotes (,,,)"""
-        try:
-            with open(file_path, "r") as f:
-                next(f)  # Skip header
-                for row_num, line in enumerate(f, start=2):
-                    stripped_line = line.strip()
-
-                    if stripped_line and all(c in [",", " "] for c in stripped_line):
-                        self.add_error(
-                            f"Row {row_num} is empty or contains only whitespace"
-                        )
-                        raise ValueError(
-                            f"Row {row_num} is empty or contains only whitespace"
-                        )
+        stripped = line.strip()
+        if stripped.strip(", "):
+            return
 
-            return True
+        if stripped:
+            # Rows that are just commas with no quotes (,,,)
+            message = f"Row {row_num} is empty or contains only whitespace"
+        else:
+            # Completely empty rows
+            message = f"Row {row_num} cannot be empty (use quotes for empty cells)"
 
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Unexpected error checking empty rows: {str(e)}")
-            return False
+        self.add_error(message)
+        raise ValueError(message)
 
 
 # TODO TESTS FOR CAPTIONSHELPER
@@ -624,41 +425,39 @@ class CaptionsHelper:
                 ]
             }
         """
-        product_info = {}
+        product_info: Dict[str, Dict[str, int]] = {}
 
         with open(file_path, "r", encoding="utf-8") as f:
             reader = csv.reader(f, delimiter=separator)
             headers = next(reader)
 
-            # Get product columns and their content types
-            product_cols = [
-                (i, h[8:]) for i, h in enumerate(headers) if h.startswith("product_")
-            ]
+            # Group product column indices by content type
+            cols_by_type: Dict[str, List[int]] = {}
+            for i, h in enumerate(headers):
+                if h.startswith("product_"):
+                    cols_by_type.setdefault(h[8:], []).append(i)
 
             # Initialize tracking
-            product_info = {ct: {} for _, ct in product_cols}
+            product_info = {ct: {} for ct in cols_by_type}
 
-            # Process each row
-            for row in reader:
-                # Count products in this row
-                for col_idx, content_type in product_cols:
-                    product = row[col_idx].strip()
-                    if product and product != '""':
-                        # Update max count if this row has more
-                        current_max = (
-                            product_info[content_type]
-                            .get(product, {})
-                            .get("min_occurrences", 0)
-                        )
-                        row_count = sum(
-                            1
-                            for i, ct in product_cols
-                            if ct == content_type and row[i].strip() == product
-                        )
-
-                        product_info[content_type][product] = {
-                            "min_occurrences": max(current_max, row_count)
-                        }
+            if os.path.getsize(file_path) >= LARGE_CAPTIONS_FILE_SIZE:
+                # Large files are counted column-wise by pandas instead
+                CaptionsHelper._count_occurrences_vectorized(
+                    file_path, separator, cols_by_type, product_info
+                )
+            else:
+                # Process each row
+                for row in reader:
+                    for content_type, cols in cols_by_type.items():
+                        # Count products of this content type in this row
+                        row_counts = Counter(row[i].strip() for i in cols)
+                        type_info = product_info[content_type]
+
+                        for product, row_count in row_counts.items():
+                            if product not in EMPTY_CELL_VALUES:
+                                # Update max count if this row has more
+                                if row_count > type_info.get(product, 0):
+                                    type_info[product] = row_count
 
         # Convert to final format matching metadata structure
         return {
@@ -666,13 +465,57 @@ class CaptionsHelper:
                 {
                     "name": prod_name,
                     "prevent_duplicates": False,  # This will be set later in metadata
-                    "min_occurrences": info["min_occurrences"],
+                    "min_occurrences": min_occurrences,
                 }
-                for prod_name, info in sorted(prods.items())  # Sort by product name
+                for prod_name, min_occurrences in sorted(prods.items())  # Sort by product name
             ]
             for ct, prods in product_info.items()
         }
 
+    @staticmethod
+    def _count_occurrences_vectorized(
+        file_path: Path,
+        separator: str,
+        cols_by_type: Dict[str, List[int]],
+        product_info: Dict[str, Dict[str, int]],
+    ) -> None:
+        """Fill product_info with per-row max product counts using pandas
+
+        Args:
+            file_path: Path to validated captions.csv
+            separator: CSV separator character
+            cols_by_type: Product column indices grouped by content type
+            product_info: Dict[content_type, Dict[product, max_count]] to fill
+        """
+        import pandas as pd  # type: ignore
+
+        # Read positionally so duplicate headers aren't renamed by pandas
+        try:
+            df = pd.read_csv(
+                file_path,
+                sep=separator,
+                header=None,
+                skiprows=1,
+                dtype=str,
+                keep_default_na=False,
+                encoding="utf-8",
+            )
+        except pd.errors.EmptyDataError:
+            return  # Headers only, nothing to count
+
+        for content_type, cols in cols_by_type.items():
+            # One long Series of stripped cells, indexed by row
+            cells = pd.concat([df[i].str.strip() for i in cols])
+            cells = cells[~cells.isin(EMPTY_CELL_VALUES)]
+            if cells.empty:
+                continue
+
+            per_row = cells.groupby([cells.index, cells.values]).size()
+            max_per_product = per_row.groupby(level=1).max()
+            product_info[content_type].update(
+                (product, int(count)) for product, count in max_per_product.items()
+            )
+
     """    
     @staticmethod
     def get_captions(
@@ -734,31 +577,33 @@ class CaptionsHelper:
             reader = csv.reader(f, delimiter=separator)
             headers = next(reader)
             headers = [h.strip() for h in headers]
-            for row in reader:
-                rows.append(row)
-
-        # Initialize structure
-        by_type: Dict[str, Dict[str, List[str]]] = {
-            content_type: {product: [] for product in products.get(content_type, [])}
-            for content_type in content_types
-        }
 
-        # Map content/product columns per type
-        product_cols = {
-            ct: [i for i, h in enumerate(headers) if h == f"product_{ct}"]
-            for ct in content_types
-        }
-        content_cols = {
-            ct: [i for i, h in enumerate(headers) if h == ct] for ct in content_types
-        }
+            # Initialize structure
+            by_type: Dict[str, Dict[str, List[str]]] = {
+                content_type: {product: [] for product in products.get(content_type, [])}
+                for content_type in content_types
+            }
 
-        for row in rows:
+            # Pair up product/content columns per type once:
+            # (product index, content index, highest index, captions by product)
+            column_pairs: List[Tuple[int, int, int, Dict[str, List[str]]]] = []
             for ct in content_types:
-                for p_idx, c_idx in zip(product_cols.get(ct, []), content_cols.get(ct, [])):
-                    if p_idx < len(row) and c_idx < len(row):
-                        product = (row[p_idx] or "").strip()
-                        content = (row[c_idx] or "").strip()
-                        if product and content and product in by_type.get(ct, {}):
-                            by_type[ct][product].append(content)
+                product_cols = [i for i, h in enumerate(headers) if h == f"product_{ct}"]
+                content_cols = [i for i, h in enumerate(headers) if h == ct]
+                column_pairs.extend(
+                    (p_idx, c_idx, max(p_idx, c_idx), by_type[ct])
+                    for p_idx, c_idx in zip(product_cols, content_cols)
+                )
+
+            # Sort captions into by_type while streaming the rows
+            for row in reader:
+                rows.append(row)
+                row_len = len(row)
+                for p_idx, c_idx, last_idx, captions_by_product in column_pairs:
+                    if last_idx < row_len:
+                        product = row[p_idx].strip()
+                        content = row[c_idx].strip()
+                        if product and content and product in captions_by_product:
+                            captions_by_product[product].append(content)
 
         return {"headers": headers, "captions": rows, "by_type": by_type}
\ No newline at end of file
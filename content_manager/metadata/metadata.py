@@ -1,4 +1,6 @@
 import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Literal, Optional
 
@@ -135,7 +137,8 @@ class Metadata:
 
         Flow:
         1. Validate JSON serialization
-        2. Write to disk with pretty printing
+        2. Write to a temporary file with pretty printing
+        3. Replace metadata.json with it, so readers never see a partial file
 
         Raises:
             ValueError: If data is not JSON serializable
@@ -143,12 +146,28 @@ class Metadata:
         """
         path = self.base_path / "metadata.json"
         try:
-            # Verify JSON serialization first
-            json.dumps(self.data)
-
-            with open(path, "w") as f:
-                json.dump(self.data, f, indent=2)
+            # Serializing up front also verifies the data before touching disk
+            text = json.dumps(self.data, indent=2)
         except (TypeError, ValueError) as e:
             raise ValueError(f"Metadata is not JSON serializable: {e}")
+
+        tmp_path = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, prefix=".metadata.", suffix=".tmp", delete=False
+            ) as f:
+                tmp_path = f.name
+                f.write(text)
+            if path.exists():
+                # Keep the permissions of the file being replaced
+                os.chmod(tmp_path, path.stat().st_mode & 0o777)
+            else:
+                # Temp files are created 0600 - use what open(path, "w") would give
+                umask = os.umask(0)
+                os.umask(umask)
+                os.chmod(tmp_path, 0o666 & ~umask)
+            os.replace(tmp_path, path)
         except OSError as e:
+            if tmp_path and os.path.exists(tmp_path):
+                os.remove(tmp_path)
             raise OSError(f"Failed to save metadata file: {e}")
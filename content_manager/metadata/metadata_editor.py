@@ -1,7 +1,7 @@
 import ast
 import json
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Callable, Dict, List, Literal, Optional
 
 from config.logging import logger
 from content_manager.settings.settings_constants import DEFAULT_TEMPLATE
@@ -144,14 +144,14 @@ class MetadataEditor:
                 "settings": {...}  # From image metadata
             }
         """
-        logger.debug(f"\n=== Metadata editor get_settings Debug ===")
-        logger.debug(f"Inputs - level: {level}, target: {target}, content_type: {content_type}")
+        logger.debug("\n=== Metadata editor get_settings Debug ===")
+        logger.debug("Inputs - level: %s, target: %s, content_type: %s", level, target, content_type)
         if level == "default":
-            logger.debug(f"1. Getting default settings from: {DEFAULT_TEMPLATE}")
+            logger.debug("1. Getting default settings from: %s", DEFAULT_TEMPLATE)
             try:
                 with open(DEFAULT_TEMPLATE) as f:
                     default_settings = json.load(f)
-                logger.debug(f"2. Loaded default settings: {default_settings}")
+                logger.debug("2. Loaded default settings: %s", default_settings)
                 return {"settings_source": "default", "settings": default_settings}
             except (IOError, json.JSONDecodeError) as e:
                 raise ValueError(f"Failed to load default template: {str(e)}")
@@ -159,20 +159,20 @@ class MetadataEditor:
             return {"settings_source": "default", "settings": default_settings}
 
         if level == "content_type":
-            logger.debug(f"1. Settings dict: {self.metadata['settings']}")
+            logger.debug("1. Settings dict: %s", self.metadata['settings'])
             if not target:
                 raise ValueError("specific content_type target required for content_type level")
             if target not in self.metadata["content_types"]:
                 raise ValueError(f"Invalid content type: {target}")
             content_settings = self.metadata["settings"].get(target, {})
-            logger.debug(f"2. Content type settings: {content_settings}")
+            logger.debug("2. Content type settings: %s", content_settings)
             return {
                 "settings_source": "content_type",
                 "settings": content_settings.get("content"),
             }
 
         if level == "product":
-            logger.debug(f"1. Settings dict: {self.metadata['settings']}")
+            logger.debug("1. Settings dict: %s", self.metadata['settings'])
             if not target:
                 raise ValueError("Product name required for product level")
             if not content_type:
@@ -180,14 +180,14 @@ class MetadataEditor:
 
             # Get product settings for the specific content type
             content_settings = self.metadata["settings"].get(content_type, {})
-            logger.debug(f"2. Content type settings: {content_settings}")
+            logger.debug("2. Content type settings: %s", content_settings)
 
             # Look for the product in the settings
             # The key will be "[magnesium]" for single product
             single_product_key = f"[{target}]"
-            logger.debug(f"3a. Product key: {single_product_key}")
+            logger.debug("3a. Product key: %s", single_product_key)
             if single_product_key in content_settings:
-                logger.debug(f"3b. Product settings: {content_settings[single_product_key]}")
+                logger.debug("3b. Product settings: %s", content_settings[single_product_key])
                 return {
                     "settings_source": "product",
                     "settings": content_settings[single_product_key],
@@ -218,6 +218,73 @@ class MetadataEditor:
                 "settings": image_data.get("settings"),
             }
 
+    def get_settings_bulk(
+        self,
+        images: List[str],
+        default_loader: Optional[Callable[[], Dict]] = None,
+    ) -> Dict[str, Optional[Dict]]:
+        """Resolve the settings each image is rendered with in one pass.
+
+        Follows the image's settings_source: "content" images use their
+        content type's settings, images without stored settings or with a
+        "default" source use the default template, and everything else uses
+        the settings stored on the image.
+
+        The default template and each content type's settings are looked up
+        at most once per call, so images sharing a source share the returned
+        dict.
+
+        Args:
+            images: Image filenames to resolve
+            default_loader: Returns the default template settings; defaults to
+                reading DEFAULT_TEMPLATE through get_settings("default")
+
+        Returns:
+            Dict mapping each image to its settings, or None when the image is
+            unknown or its content type is invalid
+
+        Raises:
+            ValueError: If the default template is needed and cannot be loaded
+        """
+        resolved = {}
+        default_settings = None
+        content_settings = {}
+
+        for image_name in images:
+            image_data = self.metadata["images"].get(image_name)
+            if not image_data:
+                resolved[image_name] = None
+                continue
+
+            settings_source = image_data.get("settings_source", "default")
+
+            if settings_source == "content":
+                content_type = image_data.get("content_type")
+                if content_type not in content_settings:
+                    if content_type not in self.metadata["content_types"]:
+                        logger.error(f"Invalid content type: {content_type}")
+                        content_settings[content_type] = None
+                    else:
+                        content_settings[content_type] = (
+                            self.metadata["settings"].get(content_type, {}).get("content")
+                        )
+                resolved[image_name] = content_settings[content_type]
+                continue
+
+            if image_data.get("settings") is None or settings_source == "default":
+                if default_settings is None:
+                    default_settings = (
+                        default_loader()
+                        if default_loader
+                        else self.get_settings("default")["settings"]
+                    )
+                resolved[image_name] = default_settings
+                continue
+
+            resolved[image_name] = image_data.get("settings")
+
+        return resolved
+
     def edit_settings(
         self,
         level: Literal["content_type", "product", "custom"],
@@ -1,27 +1,90 @@
 from PIL import Image  # type: ignore
+import hashlib
 import os
+import shutil
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterator, List, Optional, Set, Tuple, Union
 
 # import imagehash
 # from PIL import Image
 
 from config.logging import logger
 
+from .settings.settings_constants import VALID_IMAGE_EXTENSIONS
 from .strict_validator import StrictValidator
 
 
+# Leading bytes of the image formats accepted in content folders (PNG, JPEG)
+IMAGE_SIGNATURES = (b"\x89PNG\r\n\x1a\n", b"\xff\xd8\xff")
+# Pillow formats to try when opening, so other image plugins are never loaded
+IMAGE_FORMATS = ("PNG", "JPEG")
+# Files allowed directly in the base folder
+BASE_FOLDER_FILES = frozenset({"captions.csv", "metadata.json"})
+# Read size used when hashing image content for duplicate detection
+HASH_CHUNK_SIZE = 64 * 1024
+# Upper bound on threads used to check content folders in parallel
+MAX_VALIDATION_WORKERS = 8
+# With verify_images, use worker processes once there are more images than this
+PROCESS_POOL_MIN_FILES = 32
+
+
+def _pillow_verify(path: str) -> bool:
+    """Validate image content using Pillow. Module level so worker processes can run it"""
+    try:
+        with Image.open(path, formats=IMAGE_FORMATS) as img:
+            img.verify()  # Verify headers without decoding full image
+        return True
+    except Exception:
+        return False
+
+
 class PathValidator(StrictValidator):
-    def __init__(self, strict: bool = True):
+    def __init__(
+        self,
+        strict: bool = True,
+        verify_images: bool = False,
+        perceptual_dedup: bool = False,
+    ):
         super().__init__(strict)
         self.base_path = None
+        # Also run Pillow's verify() on every image, not just the signature check
+        self.verify_images = verify_images
+        # Match duplicate images by perceptual hash instead of exact bytes
+        self.perceptual_dedup = perceptual_dedup
         self.content_types: Set[str] = set()
+        # Image checks per path, only kept for a single validation run
+        self._valid_image_cache: Dict[str, bool] = {}
+        # Directory listings per path, only set while a validation run is active
+        self._listing_cache: Optional[Dict[str, List[os.DirEntry]]] = None
+        # Last passing folder_validation per base path: (fingerprint, errors, warnings)
+        self._result_cache: Dict[str, Tuple[Tuple, List[str], List[str]]] = {}
+
+    @property
+    def content_types(self) -> Set[str]:
+        return self._content_types
+
+    @content_types.setter
+    def content_types(self, value: Set[str]) -> None:
+        # Assign a new set rather than mutating in place so the lowercase copy stays in sync
+        self._content_types = value
+        self._content_types_lower: FrozenSet[str] = frozenset(
+            name.lower() for name in value
+        )
 
     def validate(self, base_path: Path) -> bool:
         """Main validation method"""
         self.clear_messages()
+        self._valid_image_cache.clear()
+        self._listing_cache = {}
+        try:
+            return self._validate(base_path)
+        finally:
+            self._listing_cache = None
 
+    def _validate(self, base_path: Path) -> bool:
+        """Run the base path checks for validate()"""
         if base_path is None:
             self.add_error("Base path cannot be None")
             return False
@@ -47,15 +110,65 @@ class PathValidator(StrictValidator):
 
         return True
 
+    def invalidate_cache(self) -> None:
+        """Forget cached folder_validation results"""
+        self._result_cache.clear()
+
     def folder_validation(self, base_path: Path) -> bool:
-        """Run folder validations"""
+        """Run folder validations, reusing the last passing result if nothing changed"""
+        self._valid_image_cache.clear()
+        self._listing_cache = {}
         try:
-            # Check for unexpected folders first
-            if not self._check_unexpected_folders(base_path):
-                raise ValueError(self.errors[-1])
+            key = str(base_path)
+            fingerprint = self._fingerprint(base_path)
+            cached = self._result_cache.get(key)
+            if cached is not None and cached[0] == fingerprint:
+                logger.debug(f"Folders unchanged, reusing validation result: {base_path}")
+                self.errors.extend(cached[1])
+                self.warnings.extend(cached[2])
+                return True
+
+            error_count, warning_count = len(self.errors), len(self.warnings)
+            result = self._run_folder_checks(base_path)
+            if result and fingerprint is not None:
+                self._result_cache[key] = (
+                    fingerprint,
+                    self.errors[error_count:],
+                    self.warnings[warning_count:],
+                )
+            return result
+        finally:
+            self._listing_cache = None
+
+    def _fingerprint(self, base_path: Path) -> Optional[Tuple]:
+        """Describe the validator settings and the entries of the base and content
+        folders by path, mtime and size. Returns None if they cannot be read.
+        """
+        try:
+            entries = []
+            for folder in [base_path] + [base_path / ct for ct in sorted(self.content_types)]:
+                if not folder.is_dir():
+                    entries.append((str(folder), None))
+                    continue
+                for entry in self._scan(folder):
+                    stat = entry.stat()
+                    entries.append((entry.path, stat.st_mtime_ns, stat.st_size))
+
+            return (
+                self.strict,
+                self.verify_images,
+                self.perceptual_dedup,
+                tuple(sorted(self.content_types)),
+                tuple(entries),
+            )
+        except OSError:
+            return None
 
-            # Check for exact name matches
-            if not self._check_folder_names_exact_match(base_path):
+    def _run_folder_checks(self, base_path: Path) -> bool:
+        """Run the folder checks for folder_validation()"""
+        try:
+            # Check for unexpected folders first, then exact name matches
+            if not self._check_base_folders(base_path):
                 raise ValueError(self.errors[-1])
 
             # Check no nested folders
@@ -74,6 +187,9 @@ class PathValidator(StrictValidator):
                     raise ValueError(self.errors[-1])
                 return True  # In non-strict mode, empty folders are just warnings
 
+            # Check the images of all content folders up front, in parallel
+            self._prefetch_image_checks(base_path)
+
             # Check that only images are allowed (this will catch non-image files first)
             if not self._check_only_images_allowed(base_path):
                 raise ValueError(self.errors[-1])
@@ -98,6 +214,22 @@ class PathValidator(StrictValidator):
             self.add_error(f"Error in folder validation: {str(e)}")
             return False
 
+    def _scan(self, path: Path) -> Iterator[os.DirEntry]:
+        """Yield non-hidden directory entries, listing each directory once per validation run"""
+        if self._listing_cache is None:
+            with os.scandir(path) as it:
+                yield from (entry for entry in it if entry.name[:1] != ".")
+            return
+
+        key = str(path)
+        entries = self._listing_cache.get(key)
+        if entries is None:
+            with os.scandir(path) as it:
+                entries = self._listing_cache[key] = [
+                    entry for entry in it if entry.name[:1] != "."
+                ]
+        yield from entries
+
     def _check_folder_exists(self, base_path: Path) -> bool:
         """Check ONLY if required folders exist"""
         try:
@@ -122,34 +254,53 @@ class PathValidator(StrictValidator):
             self.add_error(f"Error checking folder existence: {str(e)}")
             return False
 
-    def _check_unexpected_folders(self, base_path: Path) -> bool:
-        """Check ONLY for unexpected folders in base path.
+    def _classify(self, entry: os.DirEntry) -> str:
+        """Sort a base folder entry into one of: content_dir, misnamed_dir,
+        metadata_dir, unexpected_dir, allowed_file, stray_file or other
+        """
+        name = entry.name
+        if entry.is_dir():
+            lower = name.lower()
+            if lower in self._content_types_lower:
+                # Case-sensitive check
+                return "content_dir" if name in self.content_types else "misnamed_dir"
+            if lower == "metadata":
+                return "metadata_dir"
+            return "unexpected_dir"
+
+        if entry.is_file():
+            return "allowed_file" if name in BASE_FOLDER_FILES else "stray_file"
+        return "other"
+
+    def _check_base_folders(self, base_path: Path) -> bool:
+        """Check unexpected folders, then exact folder names, in one pass over base path.
         In non-strict mode, unexpected folders become warnings so the UI can launch.
         """
         try:
-            allowed = {name.lower() for name in self.content_types} | {"metadata"}
-
-            for item in base_path.iterdir():
-                if item.name.startswith("."):
+            unexpected = []
+            misnamed = []
+            for entry in self._scan(base_path):
+                kind = self._classify(entry)
+                if kind == "unexpected_dir":
+                    unexpected.append(entry)
+                elif kind == "misnamed_dir":
+                    misnamed.append(entry)
+
+            for entry in unexpected:
+                # Special handling for preview folder
+                if entry.name.lower() == "preview":
+                    logger.warning(f"Found a preview folder, deleting it: {entry.path}")
+                    shutil.rmtree(entry.path)
+                    if self._listing_cache is not None:
+                        self._listing_cache.clear()
                     continue
 
-                if item.is_dir() and item.name.lower() not in allowed:
-                    # Special handling for preview folder
-                    if item.name.lower() == "preview":
-                        import shutil
-                        logger.warning(f"Found a preview folder, deleting it: {item}")
-                        shutil.rmtree(item)
-                        continue
-
-                    msg = f"Unexpected folder(s) found: {item.name}"
-                    if self.strict:
-                        self.add_error(msg)
-                        raise ValueError(msg)
-                    else:
-                        self.add_warning(msg)
-                        continue
-
-            return True
+                msg = f"Unexpected folder(s) found: {entry.name}"
+                if self.strict:
+                    self.add_error(msg)
+                    raise ValueError(msg)
+                else:
+                    self.add_warning(msg)
 
         except ValueError:
             raise
@@ -157,6 +308,12 @@ class PathValidator(StrictValidator):
             self.add_error(f"Error checking unexpected folders: {str(e)}")
             return False
 
+        for entry in misnamed:
+            msg = f"Invalid folder name: '{entry.name}' must exactly match content type '{entry.name.lower()}'"
+            self.add_error(msg)
+            raise ValueError(msg)
+        return True
+
     def _check_folder_permissions(self, base_path: Path) -> bool:
         """Check ONLY permissions for all folders"""
         try:
@@ -185,11 +342,9 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue  # Skip non-existent folders - handled by exists check
 
-                for item in folder_path.iterdir():
-                    if item.name.startswith("."):
-                        continue
-                    if not item.is_file() or not self._is_valid_image(item):
-                        msg = f"Invalid file in {content_type} folder: {item.name}"
+                for entry in self._scan(folder_path):
+                    if not entry.is_file() or not self._is_valid_image(entry):
+                        msg = f"Invalid file in {content_type} folder: {entry.name}"
                         self.add_error(msg)
                         raise ValueError(msg)
             return True
@@ -199,18 +354,89 @@ class PathValidator(StrictValidator):
             self.add_error(f"Error checking folder contents: {str(e)}")
             return False
 
-    def _is_valid_image(self, file_path: Path) -> bool:
-        """Helper to check if file is a valid image"""
+    def _prefetch_image_checks(self, base_path: Path) -> None:
+        """Fill the image cache for all content folders using a thread pool"""
+        file_groups = []
+        for content_type in sorted(self.content_types):
+            folder_path = base_path / content_type
+            try:
+                files = [
+                    entry
+                    for entry in self._scan(folder_path)
+                    if entry.is_file() and entry.path not in self._valid_image_cache
+                ]
+            except OSError:
+                continue  # Reported by the checks that follow
+            if files:
+                file_groups.append(files)
+
+        if not file_groups:
+            return
+
+        file_count = sum(len(files) for files in file_groups)
+        if self.verify_images and file_count > PROCESS_POOL_MIN_FILES:
+            self._verify_images_in_processes(file_groups)
+            return
+
+        workers = min(MAX_VALIDATION_WORKERS, len(file_groups))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Merge on this thread so the cache is only written from one place
+            for results in executor.map(self._verify_image_batch, file_groups):
+                self._valid_image_cache.update(results)
+
+    def _verify_images_in_processes(self, file_groups: List[List[os.DirEntry]]) -> None:
+        """Run Pillow's verify() across processes - it holds the GIL, unlike the
+        signature check, which stays on this thread
+        """
+        paths = []
+        for files in file_groups:
+            for entry in files:
+                if self._has_image_signature(entry):
+                    paths.append(entry.path)
+                else:
+                    self._valid_image_cache[entry.path] = False
+
+        try:
+            with ProcessPoolExecutor() as executor:
+                results = list(executor.map(_pillow_verify, paths, chunksize=16))
+        except Exception as e:
+            # Leave the remaining images to be checked one by one
+            logger.warning(f"Could not verify images in parallel: {str(e)}")
+            return
+        self._valid_image_cache.update(zip(paths, results))
+
+    def _verify_image_batch(self, entries: List[os.DirEntry]) -> Dict[str, bool]:
+        """Check a batch of images, keyed like the image cache"""
+        return {entry.path: self._verify_image(entry) for entry in entries}
+
+    def _is_valid_image(self, file_path: Union[Path, os.DirEntry]) -> bool:
+        """Helper to check if file is a valid image, cached per validation run"""
+        key = os.fspath(file_path)
+        is_valid = self._valid_image_cache.get(key)
+        if is_valid is None:
+            is_valid = self._valid_image_cache[key] = self._verify_image(file_path)
+        return is_valid
+
+    @staticmethod
+    def _has_image_extension(name: str) -> bool:
+        """Check only the file extension"""
+        return os.path.splitext(name)[1].lower() in VALID_IMAGE_EXTENSIONS
+
+    def _verify_image(self, file_path: Union[Path, os.DirEntry]) -> bool:
+        """Check the extension and file signature, optionally verify with Pillow"""
+        if not self._has_image_signature(file_path):
+            return False
+        return not self.verify_images or _pillow_verify(os.fspath(file_path))
+
+    def _has_image_signature(self, file_path: Union[Path, os.DirEntry]) -> bool:
+        """Check the extension and the magic bytes instead of parsing the image"""
         try:
             # Get file extension and check if it's an image extension
-            ext = file_path.suffix.lower()
-            if ext not in [".png", ".jpg", ".jpeg"]:
+            if not self._has_image_extension(file_path.name):
                 return False
 
-            # Validate image content using Pillow
-            with Image.open(file_path) as img:
-                img.verify()  # Verify headers without decoding full image
-            return True
+            with open(file_path, "rb") as f:
+                return f.read(8).startswith(IMAGE_SIGNATURES)
         except Exception:
             return False
 
@@ -255,28 +481,6 @@ class PathValidator(StrictValidator):
 
         return True
 
-    def _check_folder_names_exact_match(self, base_path: Path) -> bool:
-        """Check ONLY if folder names match content types exactly"""
-        try:
-            for item in base_path.iterdir():
-                if item.name.startswith("."):
-                    continue
-
-                if item.is_dir() and item.name.lower() in {
-                    name.lower() for name in self.content_types
-                }:
-                    if item.name not in self.content_types:  # Case-sensitive check
-                        msg = f"Invalid folder name: '{item.name}' must exactly match content type '{item.name.lower()}'"
-                        self.add_error(msg)
-                        raise ValueError(msg)
-            return True
-
-        except ValueError:
-            raise
-        except Exception as e:
-            self.add_error(f"Error checking folder names: {str(e)}")
-            return False
-
     def _check_folders_not_empty(self, base_path: Path) -> bool:
         """Check ONLY if content folders contain any files"""
         try:
@@ -285,12 +489,8 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                # Check if folder has any non-hidden files
-                has_files = False
-                for item in folder_path.iterdir():
-                    if not item.name.startswith(".") and item.is_file():
-                        has_files = True
-                        break
+                # Check if folder has any non-hidden files, stopping at the first one
+                has_files = any(entry.is_file() for entry in self._scan(folder_path))
 
                 if not has_files:
                     msg = f"Folder is empty: {content_type}"
@@ -309,21 +509,19 @@ class PathValidator(StrictValidator):
             return False
 
     def _check_only_images_allowed(self, base_path: Path) -> bool:
-        """Check ONLY that all files in content folders are valid images"""
+        """Check ONLY that all files in content folders are valid images.
+        Only looks one level deep - _check_no_nested_folders must run first.
+        """
         try:
             for content_type in self.content_types:
                 folder_path = base_path / content_type
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.rglob("*"):
-                    # Skip hidden files and directories
-                    if item.name.startswith("."):
-                        continue
-
-                    if item.is_file():
-                        if not self._is_valid_image(item):
-                            msg = f"Invalid file in {content_type} folder: {item.name}"
+                for entry in self._scan(folder_path):
+                    if entry.is_file():
+                        if not self._is_valid_image(entry):
+                            msg = f"Invalid file in {content_type} folder: {entry.name}"
                             self.add_error(msg)
                             raise ValueError(msg)
             return True
@@ -337,25 +535,19 @@ class PathValidator(StrictValidator):
     def _check_base_folder_files(self, base_path: Path) -> bool:
         """Check ONLY that base folder contains only allowed files, warn about images"""
         try:
-            allowed_files = {"captions.csv", "metadata.json"}
-
-            for item in base_path.iterdir():
-                if item.name.startswith("."):
-                    continue
-
-                if item.is_file():
-                    if item.name not in allowed_files:
-                        # Check if it's an image
-                        if self._is_valid_image(item):
-                            msg = f"Image found in base folder: {item.name}. Consider moving to appropriate content folder."
-                            self.add_warning(msg)
-                            if self.strict:
-                                raise ValueError(msg)
-                        else:
-                            # Non-image files not allowed
-                            msg = f"Invalid file in base folder: {item.name}"
-                            self.add_error(msg)
+            for entry in self._scan(base_path):
+                if self._classify(entry) == "stray_file":
+                    # Check if it's an image
+                    if self._is_valid_image(entry):
+                        msg = f"Image found in base folder: {entry.name}. Consider moving to appropriate content folder."
+                        self.add_warning(msg)
+                        if self.strict:
                             raise ValueError(msg)
+                    else:
+                        # Non-image files not allowed
+                        msg = f"Invalid file in base folder: {entry.name}"
+                        self.add_error(msg)
+                        raise ValueError(msg)
 
             return True
 
@@ -373,12 +565,9 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
-                    if item.name.startswith("."):
-                        continue
-
-                    if item.is_dir():
-                        msg = f"Nested folder found in {content_type}: {item.name}"
+                for entry in self._scan(folder_path):
+                    if entry.is_dir():
+                        msg = f"Nested folder found in {content_type}: {entry.name}"
                         self.add_error(msg)
                         raise ValueError(msg)
 
@@ -398,14 +587,10 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
-                    if item.name.startswith("."):
-                        continue
-
-                    if item.is_file():
-                        ext = item.suffix.lower()
-                        if ext not in [".png", ".jpg", ".jpeg"]:
-                            msg = f"Invalid image format in {content_type}: {item.name}"
+                for entry in self._scan(folder_path):
+                    if entry.is_file():
+                        if not self._has_image_extension(entry.name):
+                            msg = f"Invalid image format in {content_type}: {entry.name}"
                             self.add_error(msg)
                             raise ValueError(msg)
             return True
@@ -417,25 +602,29 @@ class PathValidator(StrictValidator):
             return False
 
     def _check_duplicate_image_names(self, base_path: Path) -> bool:
-        """Check ONLY for duplicate image names (case-insensitive, extension-independent)"""
+        """Check ONLY for duplicate image names (case-insensitive, extension-independent).
+        Content folder images are picked by extension - _check_only_images_allowed has
+        already checked their content. Base folder files are not checked earlier in
+        folder_validation, so they are still picked by content.
+        """
         try:
-            name_map = defaultdict(list)
+            seen: Dict[str, str] = {}
+            dups: Dict[str, List[str]] = {}
+            base_prefix = os.path.join(str(base_path), "")
 
-            # Helper function to add file to name_map
-            def add_file(file_path: Path):
-                base_name = file_path.stem.lower()
+            # Helper function to track file names
+            def add_file(entry: os.DirEntry):
+                base_name = os.path.splitext(entry.name)[0].lower()
                 # Store path - if in base folder, just filename, otherwise relative path
-                if file_path.parent == base_path:
-                    name_map[base_name].append(file_path.name)
-                else:
-                    rel_path = file_path.relative_to(base_path)
-                    name_map[base_name].append(str(rel_path))
+                self._track_duplicate(
+                    seen, dups, base_name, self._rel(base_prefix, entry.path)
+                )
 
             # Check base folder first
-            for item in base_path.iterdir():
-                if item.is_file() and not item.name.startswith("."):
-                    if self._is_valid_image(item):
-                        add_file(item)
+            for entry in self._scan(base_path):
+                if entry.is_file():
+                    if self._is_valid_image(entry):
+                        add_file(entry)
 
             # Check each content folder
             for folder in sorted(self.content_types):  # Sort folders for consistency
@@ -443,20 +632,16 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
-                    if item.is_file() and not item.name.startswith("."):
-                        if self._is_valid_image(item):
-                            add_file(item)
-
-            # Check for duplicates - ensure consistent sorting
-            duplicates = {
-                name: sorted(paths)
-                for name, paths in name_map.items()
-                if len(paths) > 1
-            }
-            if duplicates:
+                for entry in self._scan(folder_path):
+                    if entry.is_file():
+                        if self._has_image_extension(entry.name):
+                            add_file(entry)
+
+            # Report duplicates - ensure consistent sorting
+            if dups:
                 msg = "Duplicate image names found:\n" + "\n".join(
-                    f"[{', '.join(paths)}]" for paths in sorted(duplicates.values())
+                    f"[{', '.join(paths)}]"
+                    for paths in sorted(sorted(paths) for paths in dups.values())
                 )
                 self.add_error(msg)
                 raise ValueError(msg)
@@ -469,27 +654,56 @@ class PathValidator(StrictValidator):
             self.add_error(f"Error checking image names: {str(e)}")
             return False
 
+    @staticmethod
+    def _rel(base_prefix: str, path: str) -> str:
+        """Return path relative to the base folder, given the base path with a trailing separator"""
+        return path[len(base_prefix):] if path.startswith(base_prefix) else path
+
+    @staticmethod
+    def _track_duplicate(seen: Dict, dups: Dict, key, path: str) -> None:
+        """Record path under key, moving the key to dups on its second sighting"""
+        if key in dups:
+            dups[key].append(path)
+        elif key in seen:
+            dups[key] = [seen.pop(key), path]
+        else:
+            seen[key] = path
+
+    @staticmethod
+    def _hash_file(file_path: Union[Path, str]) -> bytes:
+        """Return a short content digest, reading the file in chunks"""
+        h = hashlib.blake2b(digest_size=16)
+        with open(file_path, "rb") as f:
+            while chunk := f.read(HASH_CHUNK_SIZE):
+                h.update(chunk)
+        return h.digest()
+
+    @staticmethod
+    def _perceptual_hash(file_path: Union[Path, str]):
+        """Return a perceptual hash that ignores metadata-only differences"""
+        import imagehash
+
+        with Image.open(file_path, formats=IMAGE_FORMATS) as img:
+            return imagehash.phash(img)
+
     def _check_duplicate_image_content(self, base_path: Path) -> bool:
         """Check ONLY for duplicate image content using image hashing"""
         try:
-            hash_map = defaultdict(list)
+            # Files can only be duplicates if their sizes match, so group by
+            # size first and hash only the groups with more than one file.
+            # Perceptual duplicates can differ in size, so they share one group.
+            size_groups = defaultdict(list)
 
-            # Helper function to add file to hash_map
-            def add_file(file_path: Path):
-                if self._is_valid_image(file_path):
-                    with open(file_path, "rb") as f:
-                        content = f.read()
-                    # Store path - if in base folder, just filename, otherwise relative path
-                    if file_path.parent == base_path:
-                        hash_map[content].append(file_path.name)
-                    else:
-                        rel_path = file_path.relative_to(base_path)
-                        hash_map[content].append(str(rel_path))
+            # Helper function to add file to size_groups
+            def add_file(entry: os.DirEntry):
+                if self._is_valid_image(entry):
+                    size = None if self.perceptual_dedup else entry.stat().st_size
+                    size_groups[size].append(entry.path)
 
             # Process base folder
-            for item in base_path.iterdir():
-                if item.is_file() and not item.name.startswith("."):
-                    add_file(item)
+            for entry in self._scan(base_path):
+                if entry.is_file():
+                    add_file(entry)
 
             # Process content folders
             for folder in sorted(self.content_types):  # Sort folders for consistency
@@ -497,17 +711,31 @@ class PathValidator(StrictValidator):
                 if not folder_path.exists():
                     continue
 
-                for item in folder_path.iterdir():
-                    if item.is_file() and not item.name.startswith("."):
-                        add_file(item)
+                for entry in self._scan(folder_path):
+                    if entry.is_file():
+                        add_file(entry)
+
+            seen: Dict[bytes, str] = {}
+            dups: Dict[bytes, List[str]] = {}
+            base_prefix = os.path.join(str(base_path), "")
+            for group in size_groups.values():
+                if len(group) < 2:
+                    continue
+                for file_path in group:
+                    if self.perceptual_dedup:
+                        content = self._perceptual_hash(file_path)
+                    else:
+                        content = self._hash_file(file_path)
+                    # Store path - if in base folder, just filename, otherwise relative path
+                    self._track_duplicate(
+                        seen, dups, content, self._rel(base_prefix, file_path)
+                    )
 
-            # Check for duplicates - ensure consistent sorting
-            duplicates = [
-                sorted(paths) for paths in hash_map.values() if len(paths) > 1
-            ]
-            if duplicates:
+            # Report duplicates - ensure consistent sorting
+            if dups:
                 msg = "Duplicate images found:\n" + "\n".join(
-                    f"[{', '.join(paths)}]" for paths in sorted(duplicates)
+                    f"[{', '.join(paths)}]"
+                    for paths in sorted(sorted(paths) for paths in dups.values())
                 )
                 self.add_error(msg)
                 raise ValueError(msg)
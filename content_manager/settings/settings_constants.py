@@ -1,4 +1,6 @@
+import re
 from pathlib import Path
+from types import MappingProxyType
 
 VALID_TEXT_TYPES = {
     "plain": {
@@ -11,15 +13,50 @@ VALID_TEXT_TYPES = {
     },
 }
 
+# Required color keys per text type, as sets for subset checks
+REQUIRED_COLOR_KEYS = {
+    text_type: frozenset(info["required_color_keys"])
+    for text_type, info in VALID_TEXT_TYPES.items()
+}
+
+# Exact key sets of a settings block and its sections
+SETTINGS_SECTION_KEYS = frozenset({"base_settings", "text_settings"})
+BASE_SETTINGS_KEYS = frozenset({"default_text_type"})
+TEXT_SETTING_FIELDS = frozenset(
+    {"font_size", "font", "style_type", "style_value", "colors", "position", "margins"}
+)
+POSITION_KEYS = frozenset(
+    {"vertical", "horizontal", "vertical_jitter", "horizontal_jitter"}
+)
+MARGIN_KEYS = frozenset({"top", "bottom", "left", "right"})
+
+# Exactly "#" followed by 6 uppercase hex digits
+HEX_COLOR_RE = re.compile(r"^#[0-9A-F]{6}$")
+
+# Template names that pass every save_template name rule: lowercase ASCII
+# letters, digits, "_" and "." with at least one letter. Other names fall
+# back to the individual checks for their specific error messages.
+TEMPLATE_NAME_RE = re.compile(r"[a-z0-9_.]*[a-z][a-z0-9_.]*")
+
 # Define paths relative to the package directory to avoid CWD issues
 BASE_DIR = Path(__file__).resolve().parents[2]  # .../tiktok_slides (package root)
 TEMPLATE_PATH = BASE_DIR / "assets" / "templates"
 DEFAULT_TEMPLATE = TEMPLATE_PATH / "default.json"
 
-VALID_IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".PNG", ".JPG", ".JPEG"}
+# Lowercase only - compare against suffix.lower()
+VALID_IMAGE_EXTENSIONS = frozenset({".jpg", ".jpeg", ".png"})
+
 
+def _freeze(value):
+    """Recursively make nested defaults read-only: dicts become mappingproxies, lists tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
 
-MULTI_COLOUR_SETTINGS_BACKUP = {
+
+MULTI_COLOUR_SETTINGS_BACKUP = _freeze({
     "base_settings": {"default_text_type": "plain"},
     "text_settings": {
         "plain": {
@@ -57,4 +94,4 @@ MULTI_COLOUR_SETTINGS_BACKUP = {
             "margins": {"top": 0.05, "bottom": 0.05, "left": 0.05, "right": 0.05},
         },
     },
-}
+})
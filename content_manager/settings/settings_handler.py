@@ -1,15 +1,69 @@
 import ast
 import copy
-import json
+import os
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Set, Union
+from typing import Dict, FrozenSet, Iterator, List, Literal, Optional, Set, Tuple, Union
 
-from config.logging import logger
+import orjson
+
+from config.logging import TRACE_LEVEL, logger
 from content_manager.metadata.metadata import Metadata
 from content_manager.settings.settings_constants import VALID_TEXT_TYPES, Path as _PathAlias
+from content_manager.settings.settings_constants import HEX_COLOR_RE, REQUIRED_COLOR_KEYS, TEMPLATE_NAME_RE
 from content_manager.settings.settings_constants import DEFAULT_TEMPLATE, TEMPLATE_PATH, BASE_DIR
 from content_manager.settings.settings_validator import SettingsValidator
 
+# Parsed and validated templates by path: (st_mtime_ns, st_size, settings).
+# Entries are reused only while the file's mtime and size are unchanged.
+_TEMPLATE_CACHE: Dict[str, Tuple[int, int, Dict]] = {}
+
+# modify_settings keyword -> path of the value inside a text type's settings
+TEXT_SETTING_PATHS = {
+    "font_size": ("font_size",),
+    "font": ("font",),
+    "style_value": ("style_value",),
+    "colors": ("colors",),
+    "vertical_position": ("position", "vertical"),
+    "horizontal_position": ("position", "horizontal"),
+    "vertical_jitter": ("position", "vertical_jitter"),
+    "horizontal_jitter": ("position", "horizontal_jitter"),
+    "top_margin": ("margins", "top"),
+    "bottom_margin": ("margins", "bottom"),
+    "left_margin": ("margins", "left"),
+    "right_margin": ("margins", "right"),
+}
+
+
+def _clone_settings(value):
+    """Copy a settings tree of dicts and lists, sharing the immutable leaves.
+    Much cheaper than copy.deepcopy for plain JSON-style data.
+    """
+    if type(value) is dict:
+        return {k: _clone_settings(v) for k, v in value.items()}
+    if type(value) is list:
+        return [_clone_settings(v) for v in value]
+    if isinstance(value, (str, int, float, bool, type(None))):
+        return value
+    return copy.deepcopy(value)
+
+
+@lru_cache(maxsize=1024)
+def _parse_group_name(group: str) -> Tuple[str, ...]:
+    """Product names in a "[product1, product2]" group key, empty for other keys.
+    Group keys are immutable strings, so cached results never go stale.
+    """
+    if not (group.startswith("[") and group.endswith("]")):
+        return ()
+    return tuple(p.strip() for p in group[1:-1].split(","))
+
+
+@lru_cache(maxsize=1024)
+def _group_product_set(group: str) -> FrozenSet[str]:
+    """Products of a group key as a set, for membership tests."""
+    return frozenset(_parse_group_name(group))
+
 
 class Settings:
     """Handles all settings operations and validation for content and product settings.
@@ -123,9 +177,28 @@ class Settings:
             self.templates_dir = (BASE_DIR / "assets" / "templates")
             self.fonts_dir = (BASE_DIR / "assets" / "fonts")
 
-        self.settings_validator = SettingsValidator()
+        # Built on first use; listing templates/fonts never needs it
+        self._validator: Optional[SettingsValidator] = None
         self.metadata = None
         self.base_path = None
+        # (fonts_dir, {font file name: is a regular file}), filled on first use
+        self._fonts_cache: Optional[Tuple[Path, Dict[str, bool]]] = None
+        # Nesting depth of bulk_edit() and whether a save was deferred
+        self._bulk_depth = 0
+        self._dirty = False
+        # Settings object bulk_apply_settings has already validated
+        self._validated_settings: Optional[Dict] = None
+
+    @property
+    def settings_validator(self) -> SettingsValidator:
+        """Settings validator, created on first access."""
+        if self._validator is None:
+            self._validator = SettingsValidator()
+        return self._validator
+
+    @settings_validator.setter
+    def settings_validator(self, validator: SettingsValidator):
+        self._validator = validator
 
     def set_data(self, metadata: Metadata):
         """Use existing metadata instance.
@@ -135,6 +208,33 @@ class Settings:
         """
         self.metadata = metadata
 
+    @contextmanager
+    def bulk_edit(self) -> Iterator[None]:
+        """Defer metadata saves until the outermost block exits.
+
+        Usage:
+            with settings.bulk_edit():
+                settings.apply_product_settings("hook", "product1", my_settings)
+                settings.apply_product_settings("hook", "product2", my_settings)
+        """
+        self._bulk_depth += 1
+        try:
+            yield
+        finally:
+            self._bulk_depth -= 1
+            # Edits made before an error used to be saved one by one,
+            # so flush them even when unwinding
+            if self._bulk_depth == 0 and self._dirty:
+                self._dirty = False
+                self.metadata.save()
+
+    def _mark_dirty_or_save(self) -> None:
+        """Save metadata now, or once the enclosing bulk_edit() exits."""
+        if self._bulk_depth:
+            self._dirty = True
+        else:
+            self.metadata.save()
+
     # TEMPLATE OPERATIONS
     def list_templates(self) -> List[str]:
         """List available templates and print them to console.
@@ -144,7 +244,7 @@ class Settings:
         2. Return the list of templates for programmatic use
 
         Returns:
-            List[str]: Template names without .json extension
+            List[str]: Template names without .json extension, sorted
 
         Example:
             >>> settings = Settings()
@@ -156,18 +256,33 @@ class Settings:
             >>> print(templates)
             ['default', 'template1', 'template2']
         """
-        templates = [p.stem for p in self.templates_dir.glob("*.json")]
+        templates = self._list_names(self.templates_dir, ".json")
 
         # Print available templates
         print("Available templates:")
         if templates:
-            for template in sorted(templates):
+            for template in templates:
                 print(f"* {template}")
         else:
             print("* No templates found")
 
         return templates
 
+    @staticmethod
+    def _list_names(directory: Path, suffix: str) -> List[str]:
+        """Sorted names of the files in directory ending in suffix, with the suffix removed"""
+        try:
+            with os.scandir(directory) as it:
+                names = [
+                    entry.name[: -len(suffix)]
+                    for entry in it
+                    if entry.name.endswith(suffix) and entry.is_file()
+                ]
+        except FileNotFoundError:
+            return []
+        names.sort()
+        return names
+
     def load_template(self, name: str = "default") -> Dict:
         """Load settings template from templates directory.
 
@@ -190,20 +305,33 @@ class Settings:
             >>> my_settings = settings.load_template("default")
         """
         template_path = self.templates_dir / f"{name}.json"
-        if not template_path.exists():
+        try:
+            stat = template_path.stat()
+        except FileNotFoundError:
             raise FileNotFoundError(f"Template not found: {name}")
 
+        key = str(template_path)
+        cached = _TEMPLATE_CACHE.get(key)
+        if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+            return _clone_settings(cached[2])
+
         try:
-            with open(template_path) as f:
-                settings = json.load(f)
-        except json.JSONDecodeError as e:
+            settings = orjson.loads(template_path.read_bytes())
+        except orjson.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in template {name}: {str(e)}")
 
         if not self.settings_validator.validate_settings(settings):
             raise ValueError(f"Invalid template: {name}")
 
+        # Cache a private copy so callers can modify what they get back
+        _TEMPLATE_CACHE[key] = (stat.st_mtime_ns, stat.st_size, _clone_settings(settings))
         return settings
 
+    @staticmethod
+    def invalidate_template_cache() -> None:
+        """Drop all cached templates so the next load_template() reads from disk"""
+        _TEMPLATE_CACHE.clear()
+
     def list_fonts(self) -> List[str]:
         """List available fonts and print them to console.
 
@@ -212,7 +340,7 @@ class Settings:
         2. Return the list of fonts for programmatic use
 
         Returns:
-            List[str]: Font names without extension
+            List[str]: Font names without extension, sorted
 
         Example:
             >>> settings = Settings()
@@ -223,12 +351,12 @@ class Settings:
             >>> print(fonts)
             ['montserratbold', 'tiktokfont']
         """
-        fonts = [p.stem for p in self.fonts_dir.glob("*.ttf")]
+        fonts = self._list_names(self.fonts_dir, ".ttf")
 
         # Print available fonts
         logger.trace("Available fonts:")
         if fonts:
-            for font in sorted(fonts):
+            for font in fonts:
                 logger.trace(f"* {font}")
         else:
             logger.trace("* No fonts found")
@@ -255,17 +383,38 @@ class Settings:
         """
         # Check if font exists with exact name (case sensitive)
         font_file = f"{name}.ttf"
-        if font_file not in [f.name for f in self.fonts_dir.iterdir()]:
+        is_file = self._font_files().get(font_file)
+        if is_file is None:
+            # The listing may predate the font being added - re-read it once
+            self.refresh_fonts()
+            is_file = self._font_files().get(font_file)
+        if is_file is None:
             raise ValueError(f"Font not found: {name}")
 
-        font_path = self.fonts_dir / font_file
-
         # Basic validation - check if it's a real file
-        if not font_path.is_file():
+        if not is_file:
             raise ValueError(f"Invalid font: {name}")
 
         return f"assets.fonts.{name}.ttf"
 
+    def _font_files(self) -> Dict[str, bool]:
+        """Return the .ttf entries of the fonts directory, cached until refresh_fonts()"""
+        if self._fonts_cache is None or self._fonts_cache[0] != self.fonts_dir:
+            with os.scandir(self.fonts_dir) as it:
+                fonts = {
+                    entry.name: entry.is_file()
+                    for entry in it
+                    if entry.name.endswith(".ttf")
+                }
+            self._fonts_cache = (self.fonts_dir, fonts)
+        return self._fonts_cache[1]
+
+    def refresh_fonts(self) -> None:
+        """Forget the cached font listing, e.g. after adding fonts"""
+        self._fonts_cache = None
+        if self._validator is not None:
+            self._validator.refresh_fonts()
+
     # SETTINGS MODIFICATION
     def modify_settings(
         self,
@@ -332,9 +481,9 @@ class Settings:
             ValueError: If any values invalid
         """
 
-        # Make a deep copy of original settings to preserve in case of validation failure
-        original_settings = copy.deepcopy(settings)
-        working_copy = copy.deepcopy(settings)  # New! Work on this copy
+        # Work on a deep copy - the caller's settings are never modified, so they
+        # can be returned as-is if validation fails
+        working_copy = _clone_settings(settings)
 
         try:
             # REDO
@@ -348,40 +497,25 @@ class Settings:
             if text_type not in working_copy["text_settings"]:
                 raise ValueError(f"Invalid text_type: {text_type}")
 
-            text_settings = working_copy["text_settings"][text_type]
-
-            # MODIFICATION :: font_size
-            if font_size is not None:
-                text_settings["font_size"] = font_size
+            text_type_info = VALID_TEXT_TYPES.get(text_type)
+            if text_type_info is None:
+                raise ValueError(f"Invalid text_type: {text_type}")
 
-            # MODIFICATION :: font
-            if font is not None:
-                text_settings["font"] = font
+            text_settings = working_copy["text_settings"][text_type]
 
             # MODIFICATION :: style_value
-            if style_value is not None:
-                # Check text type has correct style_type
-                text_type_info = VALID_TEXT_TYPES.get(text_type)
-                if not text_type_info:
-                    raise ValueError(f"Invalid text_type: {text_type}")
-
-                # Simple non-negative check with dynamic style type in error
-                if style_value < 0:
-                    style_type = text_type_info["style_type"]
-                    raise ValueError(f"{style_type} cannot be negative")
-
-                text_settings["style_value"] = style_value
+            # Simple non-negative check with dynamic style type in error
+            if style_value is not None and style_value < 0:
+                style_type = text_type_info["style_type"]
+                raise ValueError(f"{style_type} cannot be negative")
 
             # MODIFICATION :: colors
             if colors is not None:
                 # Get valid color keys for this text type
-                text_type_info = VALID_TEXT_TYPES.get(text_type)
-                if not text_type_info:
-                    raise ValueError(f"Invalid text_type: {text_type}")
-
                 required_color_keys = text_type_info[
                     "required_color_keys"
                 ]  # e.g., ["text", "outline"] or ["text", "background"]
+                required_keys_set = REQUIRED_COLOR_KEYS[text_type]
 
                 # Validate each color dict
                 for color in colors:
@@ -389,109 +523,88 @@ class Settings:
                         raise ValueError("Each color must be a dictionary")
 
                     # Check all required keys exist
-                    if not all(key in color for key in required_color_keys):
+                    if not required_keys_set <= color.keys():
                         raise ValueError(
                             f"Color missing required keys: {required_color_keys}"
                         )
 
-                    # Validate hex values
+                    # Validate hex values, using the same rule as SettingsValidator
                     for key in required_color_keys:
-                        if not isinstance(color[key], str) or not color[key].startswith(
-                            "#"
-                        ):
-                            raise ValueError(
-                                f"Invalid hex color for {key}: {color[key]}"
-                            )
-
-                text_settings["colors"] = colors
+                        value = color[key]
+                        if type(value) is not str or not HEX_COLOR_RE.match(value):
+                            raise ValueError(f"Invalid hex color for {key}: {value}")
+
+            updates = {
+                "font_size": font_size,
+                "font": font,
+                "style_value": style_value,
+                "colors": colors,
+                "vertical_position": vertical_position,
+                "horizontal_position": horizontal_position,
+                "vertical_jitter": vertical_jitter,
+                "horizontal_jitter": horizontal_jitter,
+                "top_margin": top_margin,
+                "bottom_margin": bottom_margin,
+                "left_margin": left_margin,
+                "right_margin": right_margin,
+            }
 
-            # MODIFICATION :: position tuple
+            # MODIFICATION :: position tuple, mapped onto the individual fields
             if positions is not None:
                 # First check we're not mixing with individual params
-                if any(
-                    x is not None
-                    for x in [
-                        vertical_position,
-                        horizontal_position,
-                        vertical_jitter,
-                        horizontal_jitter,
-                    ]
+                if (
+                    vertical_position is not None
+                    or horizontal_position is not None
+                    or vertical_jitter is not None
+                    or horizontal_jitter is not None
                 ):
                     raise ValueError(
                         "Cannot mix positions tuple with individual position parameters"
                     )
 
                 vert_pos, horiz_pos, v_jitter, h_jitter = positions
+                updates["vertical_position"] = None if vert_pos is None else list(vert_pos)
+                updates["horizontal_position"] = (
+                    None if horiz_pos is None else list(horiz_pos)
+                )
+                updates["vertical_jitter"] = v_jitter
+                updates["horizontal_jitter"] = h_jitter
 
-                # Only update the values that aren't None
-                if vert_pos is not None:
-                    text_settings["position"]["vertical"] = list(vert_pos)
-                if horiz_pos is not None:
-                    text_settings["position"]["horizontal"] = list(horiz_pos)
-                if v_jitter is not None:
-                    text_settings["position"]["vertical_jitter"] = v_jitter
-                if h_jitter is not None:
-                    text_settings["position"]["horizontal_jitter"] = h_jitter
-            # MODIFICATION :: individual positions
-            elif any(
-                x is not None
-                for x in [
-                    vertical_position,
-                    horizontal_position,
-                    vertical_jitter,
-                    horizontal_jitter,
-                ]
-            ):
-                # Only update the values that are provided
-                if vertical_position is not None:
-                    text_settings["position"]["vertical"] = vertical_position
-                if horizontal_position is not None:
-                    text_settings["position"]["horizontal"] = horizontal_position
-                if vertical_jitter is not None:
-                    text_settings["position"]["vertical_jitter"] = vertical_jitter
-                if horizontal_jitter is not None:
-                    text_settings["position"]["horizontal_jitter"] = horizontal_jitter
-
-            # MODIFICATION :: margins tuple
+            # MODIFICATION :: margins tuple, mapped onto the individual fields
             if margins is not None:
                 # First check we're not mixing with individual params
-                if any(
-                    x is not None
-                    for x in [top_margin, bottom_margin, left_margin, right_margin]
+                if (
+                    top_margin is not None
+                    or bottom_margin is not None
+                    or left_margin is not None
+                    or right_margin is not None
                 ):
                     raise ValueError(
                         "Cannot mix margins tuple with individual margin parameters"
                     )
 
-                top, bottom, left, right = margins
-
-                # Only update the values that aren't None
-                if top is not None:
-                    text_settings["margins"]["top"] = top
-                if bottom is not None:
-                    text_settings["margins"]["bottom"] = bottom
-                if left is not None:
-                    text_settings["margins"]["left"] = left
-                if right is not None:
-                    text_settings["margins"]["right"] = right
-
-            # MODIFICATION :: individual margins
-            elif any(
-                x is not None
-                for x in [top_margin, bottom_margin, left_margin, right_margin]
-            ):
-                # Only update the values that are provided
-                if top_margin is not None:
-                    text_settings["margins"]["top"] = top_margin
-                if bottom_margin is not None:
-                    text_settings["margins"]["bottom"] = bottom_margin
-                if left_margin is not None:
-                    text_settings["margins"]["left"] = left_margin
-                if right_margin is not None:
-                    text_settings["margins"]["right"] = right_margin
-
-            # FINAL validation - this will catch ALL issues including position overlaps
-            if not self.settings_validator.validate_settings(working_copy):
+                (
+                    updates["top_margin"],
+                    updates["bottom_margin"],
+                    updates["left_margin"],
+                    updates["right_margin"],
+                ) = margins
+
+            # Only update the values that are provided
+            dirty = False
+            for field, value in updates.items():
+                if value is None:
+                    continue
+                *parents, key = TEXT_SETTING_PATHS[field]
+                target = text_settings
+                for parent in parents:
+                    target = target[parent]
+                target[key] = value
+                dirty = True
+
+            # FINAL validation - this will catch ALL issues including position overlaps.
+            # Unchanged settings already passed the input validation above.
+            if dirty and not self.settings_validator.validate_settings(working_copy):
                 raise ValueError("Invalid settings structure")
 
             return working_copy
@@ -499,7 +612,7 @@ class Settings:
         except Exception as e:
             logger.error(f"Error modifying settings: {str(e)}")
             logger.error("Returning original unmodified settings")
-            return original_settings
+            return settings
 
     def modify_base_settings(
         self, settings: Dict, default_text_type: Optional[str] = None
@@ -547,18 +660,20 @@ class Settings:
         if len(name) > 100:
             raise ValueError("Template name cannot exceed 100 characters")
 
-        if not name.isascii():
-            raise ValueError("Template name must contain only ASCII characters")
+        # One regex pass covers the usual names; only rejects pay for the rest
+        if not TEMPLATE_NAME_RE.fullmatch(name):
+            if not name.isascii():
+                raise ValueError("Template name must contain only ASCII characters")
 
-        if not name.islower():
-            raise ValueError("Template name must be lowercase")
+            if not name.islower():
+                raise ValueError("Template name must be lowercase")
 
-        if " " in name or "-" in name:
-            raise ValueError("Template name cannot contain spaces or hyphens")
+            if " " in name or "-" in name:
+                raise ValueError("Template name cannot contain spaces or hyphens")
 
         # Check if template exists
         template_path = self.templates_dir / f"{name}.json"
-        if template_path.exists():
+        if os.path.lexists(template_path):
             raise ValueError(f"Template already exists: {name}")
 
         # Validate settings
@@ -567,10 +682,11 @@ class Settings:
 
         # Save template
         try:
-            with open(template_path, "w") as f:
-                json.dump(settings, f, indent=2)
+            template_path.write_bytes(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
         except IOError as e:
             raise IOError(f"Failed to save template: {str(e)}")
+        finally:
+            self.invalidate_template_cache()
 
     def apply_content_settings(
         self, content_type: str, settings: Dict, overwrite: bool = False
@@ -590,7 +706,7 @@ class Settings:
             raise ValueError(f"Invalid content type: {content_type}")
 
         # Validate settings (None is valid, otherwise must pass validation)
-        if settings is not None:
+        if settings is not None and settings is not self._validated_settings:
             if not self.settings_validator.validate_settings(settings):
                 raise ValueError("Invalid settings structure")
 
@@ -600,8 +716,10 @@ class Settings:
         # 3. If current settings exist and are different:
         #    - If overwrite=True -> apply new settings
         #    - If overwrite=False -> raise error
-        if current["settings"] is not None:
-            if current["settings"] == settings:
+        current_settings = current["settings"]
+        if current_settings is not None:
+            # Identity first: callers often pass back the object they read
+            if current_settings is settings or current_settings == settings:
                 logger.debug(
                     f"\nSettings for {content_type} are already up to date. No changes needed."
                 )
@@ -614,7 +732,7 @@ class Settings:
         self.metadata.metadata_editor.edit_settings(
             "content_type", content_type, settings
         )
-        self.metadata.save()
+        self._mark_dirty_or_save()
 
     def apply_product_settings(
         self,
@@ -639,27 +757,26 @@ class Settings:
 
         # Check product exists in content type
         products = self.metadata.metadata_editor.get_products(content_type)
-        product_names = [p["name"] for p in products]
-        if product not in product_names:
+        # Index by name, keeping the first product when names repeat
+        products_by_name = {}
+        for prod in products:
+            products_by_name.setdefault(prod["name"], prod)
+        if product not in products_by_name:
             raise ValueError(
                 f"Product '{product}' not found in {content_type}.\n"
-                f"Available products: {json.dumps(products, indent=2)}"
+                f"Available products: {orjson.dumps(products, option=orjson.OPT_INDENT_2).decode()}"
             )
 
         # Initialize content type settings if not exists (ONCE!)
-        if content_type not in self.metadata.data["settings"]:
-            self.metadata.data["settings"][content_type] = {}
+        ct_settings = self.metadata.data["settings"].setdefault(content_type, {})
 
         # Update prevent_duplicates if specified
         if prevent_duplicates is not None:
             logger.debug(
                 f"\nUpdating duplicate prevention for {product} to: {prevent_duplicates}"
             )
-            for prod in self.metadata.data["products"][content_type]:
-                if prod["name"] == product:
-                    prod["prevent_duplicates"] = prevent_duplicates
-                    logger.debug("✓ Updated product metadata")
-                    break
+            products_by_name[product]["prevent_duplicates"] = prevent_duplicates
+            logger.debug("✓ Updated product metadata")
 
         # 2. Find Current State
         found_groups = self._find_product_groups(content_type, product)
@@ -673,9 +790,7 @@ class Settings:
             )
 
         current_group = found_groups[0] if found_groups else None
-        current_settings = self.metadata.data["settings"][content_type].get(
-            current_group
-        )
+        current_settings = ct_settings.get(current_group)
         logger.debug(f"Current group: {current_group}")
         logger.debug(f"Current settings: {current_settings}")
 
@@ -684,7 +799,10 @@ class Settings:
             if not overwrite:
                 logger.warning("\nCannot reset settings to None without overwrite=True")
                 return
-        elif not self.settings_validator.validate_settings(settings):
+        elif (
+            settings is not self._validated_settings
+            and not self.settings_validator.validate_settings(settings)
+        ):
             logger.critical("\n❌ Invalid settings structure - no changes will be made")
             raise ValueError("Missing required settings sections")
 
@@ -708,16 +826,14 @@ class Settings:
         # IMPORTANT: Remove from ALL groups before any new group creation
         self._remove_product_from_groups(content_type, product)
         logger.debug("\nAfter removal - current groups:")
-        logger.debug(self.metadata.data["settings"][content_type].keys())
+        logger.debug(ct_settings.keys())
 
         # Handle None settings after removal
         if settings is None:
             logger.debug("\nHandling None settings...")
             # Look for existing null settings group
             null_group = None
-            for group, group_settings in self.metadata.data["settings"][
-                content_type
-            ].items():
+            for group, group_settings in ct_settings.items():
                 if group == "content":
                     continue
                 if group_settings is None:
@@ -736,37 +852,41 @@ class Settings:
                     )
 
                     # Update group
-                    self.metadata.data["settings"][content_type][new_group] = None
+                    ct_settings[new_group] = None
                     if new_group != null_group:  # Only delete old if different
-                        del self.metadata.data["settings"][content_type][null_group]
+                        del ct_settings[null_group]
                     logger.debug(f"Added {product} to null settings group: {new_group}")
             else:
                 # Create new null settings group
-                self.metadata.data["settings"][content_type][f"[{product}]"] = None
+                ct_settings[f"[{product}]"] = None
                 logger.debug(f"Created new null settings group for {product}")
 
-            self.metadata.save()
+            self._mark_dirty_or_save()
             logger.debug("\nFinal state after None settings:")
-            logger.debug(self.metadata.data["settings"][content_type])
+            logger.debug(ct_settings)
             return
 
         # For non-None settings, check for matching groups
         logger.debug("\nChecking for matching settings groups...")
         matching_group = None
 
-        for group, group_settings in self.metadata.data["settings"][
-            content_type
-        ].items():
+        for group, group_settings in ct_settings.items():
             if group == "content" or group_settings is None:
                 continue
 
-            logger.trace(f"\nComparing with group: {group}")
-            logger.trace("Group settings:")
-            logger.trace(json.dumps(group_settings, indent=2))
-            logger.trace("New settings:")
-            logger.trace(json.dumps(settings, indent=2))
+            # Only serialize the settings trees when trace output is enabled
+            if logger.isEnabledFor(TRACE_LEVEL):
+                logger.trace(f"\nComparing with group: {group}")
+                logger.trace("Group settings:")
+                logger.trace(
+                    orjson.dumps(group_settings, option=orjson.OPT_INDENT_2).decode()
+                )
+                logger.trace("New settings:")
+                logger.trace(orjson.dumps(settings, option=orjson.OPT_INDENT_2).decode())
 
-            if group_settings == settings:
+            # Bulk applies store the same settings object in every group they
+            # touch, so identity usually settles the match without a deep compare
+            if group_settings is settings or group_settings == settings:
                 matching_group = group
                 logger.debug(f"✓ Found matching settings in group: {group}")
                 break
@@ -776,63 +896,77 @@ class Settings:
         # Final settings application
         if matching_group:
             # Merge into existing group
-            group_products = self._parse_group_products(matching_group)
-            if product not in group_products:
-                group_products.append(product)
-                new_group = self._create_group_name(group_products)
+            if product not in self._parse_group_products_set(matching_group):
+                new_group = self._create_group_name(
+                    [*_parse_group_name(matching_group), product]
+                )
 
-                self.metadata.data["settings"][content_type][new_group] = settings
-                del self.metadata.data["settings"][content_type][matching_group]
+                ct_settings[new_group] = settings
+                del ct_settings[matching_group]
                 logger.debug(f"Merged {product} into group {new_group}")
         else:
             # Create new group
-            self.metadata.data["settings"][content_type][f"[{product}]"] = settings
+            ct_settings[f"[{product}]"] = settings
             logger.debug(f"Created new group for {product}")
 
         # 4. Save Changes
-        self.metadata.save()
+        self._mark_dirty_or_save()
         logger.debug("\nFinal state:")
-        logger.debug(self.metadata.data["settings"][content_type])
+        logger.debug(ct_settings)
 
     def _find_product_groups(self, content_type: str, product: str) -> List[str]:
         """Find all groups containing the product."""
         found_groups = []
-        for group in self.metadata.data["settings"][content_type]:
+        ct_settings = self.metadata.data["settings"][content_type]
+        for group in ct_settings:
             if group == "content":
                 continue
-            group_products = self._parse_group_products(group)
-            if product in group_products:
+            if product in self._parse_group_products_set(group):
                 found_groups.append(group)
         return found_groups
 
+    def _build_product_index(self, content_type: str) -> Dict[str, List[str]]:
+        """Map each product to the groups containing it, in one pass over the groups."""
+        index: Dict[str, List[str]] = {}
+        ct_settings = self.metadata.data["settings"][content_type]
+        for group in ct_settings:
+            if group == "content":
+                continue
+            for product in _parse_group_name(group):
+                index.setdefault(product, []).append(group)
+        return index
+
     def _parse_group_products(self, group: str) -> List[str]:
         """Parse products from group name."""
-        if not (group.startswith("[") and group.endswith("]")):
-            return []
-        clean_group = group[1:-1]
-        return [p.strip() for p in clean_group.split(",")]
+        # Callers append/remove on the result, so hand out a fresh list
+        return list(_parse_group_name(group))
+
+    def _parse_group_products_set(self, group: str) -> FrozenSet[str]:
+        """Parse products from group name as a set, for membership checks."""
+        return _group_product_set(group)
 
     def _remove_product_from_groups(self, content_type: str, product: str) -> None:
         """Remove product from all groups it exists in."""
         logger.debug(f"\nRemoving {product} from all existing groups...")
 
-        for group, settings in list(
-            self.metadata.data["settings"][content_type].items()
-        ):
-            # Skip special keys that aren't product groups
-            if not (group.startswith("[") and group.endswith("]")):
-                continue
-
+        ct_settings = self.metadata.data["settings"][content_type]
+        # Collect the matches first so only those are copied before mutating;
+        # non-group keys such as "content" parse to an empty set
+        found = [
+            (group, settings)
+            for group, settings in ct_settings.items()
+            if product in self._parse_group_products_set(group)
+        ]
+        for group, settings in found:
+            logger.debug(f"Found in group: {group}")
             group_products = self._parse_group_products(group)
-            if product in group_products:
-                logger.debug(f"Found in group: {group}")
-                group_products.remove(product)
+            group_products.remove(product)
 
-                if group_products:  # If group still has other products
-                    new_group = f"[{', '.join(sorted(group_products))}]"
-                    self.metadata.data["settings"][content_type][new_group] = settings
-                del self.metadata.data["settings"][content_type][group]
-                logger.debug(f"Removed from group: {group}")
+            if group_products:  # If group still has other products
+                new_group = f"[{', '.join(sorted(group_products))}]"
+                ct_settings[new_group] = settings
+            del ct_settings[group]
+            logger.debug(f"Removed from group: {group}")
 
     def _create_group_name(self, products: List[str]) -> str:
         """Create sorted group name from product list."""
@@ -874,9 +1008,10 @@ class Settings:
             raise ValueError("Invalid settings structure")
 
         # 2. Validate all content types and products exist
+        content_types = set(self.metadata.metadata_editor.get_content_types())
         for content_type, products in targets.items():
             # Check content type exists
-            if content_type not in self.metadata.metadata_editor.get_content_types():
+            if content_type not in content_types:
                 raise ValueError(f"Invalid content type: {content_type}")
 
             # Check all products exist in this content type
@@ -884,7 +1019,8 @@ class Settings:
                 p["name"]
                 for p in self.metadata.metadata_editor.get_products(content_type)
             ]
-            invalid_products = [p for p in products if p not in valid_products]
+            valid_names = set(valid_products)
+            invalid_products = [p for p in products if p not in valid_names]
             if invalid_products:
                 raise ValueError(
                     f"Invalid products for {content_type}: {invalid_products}\n"
@@ -906,9 +1042,9 @@ class Settings:
                     raise ValueError("Use overwrite=True to force update")
 
                 # Check product settings
+                product_index = self._build_product_index(content_type)
                 for product in products:
-                    groups = self._find_product_groups(content_type, product)
-                    if groups:
+                    if product in product_index:
                         current = self.metadata.metadata_editor.get_settings(
                             level="product", target=product, content_type=content_type
                         )
@@ -922,34 +1058,44 @@ class Settings:
         logger.debug(f"Bulk apply - Overwrite: {overwrite}")
         logger.debug(f"Bulk apply - Prevent duplicates: {prevent_duplicates}\n")
 
-        # Process each content type and its products
-        for content_type, products in targets.items():
-            try:
-                # Apply content type settings
-                self.apply_content_settings(
-                    content_type=content_type, settings=settings, overwrite=overwrite
-                )
-                logger.debug(f"{content_type}: content settings applied")
-            except Exception as e:
-                logger.error(f"{content_type}: content settings failed - {str(e)}")
-                if not overwrite:
-                    raise
-
-            # Apply product settings
-            for product in products:
-                try:
-                    self.apply_product_settings(
-                        content_type=content_type,
-                        product=product,
-                        settings=settings,
-                        overwrite=overwrite,
-                        prevent_duplicates=prevent_duplicates,
-                    )
-                    logger.debug(f"{content_type}: {product}")
-                except Exception as e:
-                    logger.error(f"{content_type}: {product} - {str(e)}")
-                    if not overwrite:
-                        raise
+        # Process each content type and its products, writing metadata once.
+        # settings was validated above, so the per-target calls skip it.
+        self._validated_settings = settings
+        try:
+            with self.bulk_edit():
+                for content_type, products in targets.items():
+                    try:
+                        # Apply content type settings
+                        self.apply_content_settings(
+                            content_type=content_type,
+                            settings=settings,
+                            overwrite=overwrite,
+                        )
+                        logger.debug(f"{content_type}: content settings applied")
+                    except Exception as e:
+                        logger.error(
+                            f"{content_type}: content settings failed - {str(e)}"
+                        )
+                        if not overwrite:
+                            raise
+
+                    # Apply product settings
+                    for product in products:
+                        try:
+                            self.apply_product_settings(
+                                content_type=content_type,
+                                product=product,
+                                settings=settings,
+                                overwrite=overwrite,
+                                prevent_duplicates=prevent_duplicates,
+                            )
+                            logger.debug(f"{content_type}: {product}")
+                        except Exception as e:
+                            logger.error(f"{content_type}: {product} - {str(e)}")
+                            if not overwrite:
+                                raise
+        finally:
+            self._validated_settings = None
 
     def _apply_custom_settings(
         self,
@@ -1021,4 +1167,4 @@ class Settings:
             )
 
         # 7. Save changes
-        self.metadata.save()
+        self._mark_dirty_or_save()
@@ -1,11 +1,42 @@
-import re
+import os
 from pathlib import Path
-from typing import Dict, List, Literal, Optional, Union
+from typing import Any, Dict, FrozenSet, Hashable, List, Literal, Optional, Tuple, Union
 
 from content_manager.settings.settings_constants import VALID_TEXT_TYPES, BASE_DIR
+from content_manager.settings.settings_constants import HEX_COLOR_RE
+from content_manager.settings.settings_constants import (
+    BASE_SETTINGS_KEYS,
+    MARGIN_KEYS,
+    POSITION_KEYS,
+    SETTINGS_SECTION_KEYS,
+    TEXT_SETTING_FIELDS,
+)
 
 # TODO product settings cannot have duplicate settings!!!
 
+# Number of settings blocks validate_settings remembers as valid
+VALIDATION_CACHE_SIZE = 128
+# Fields every text type must have before base_settings is checked;
+# font_size is only required by the per-type pass in validate_text_settings
+STRUCTURE_FIELDS = TEXT_SETTING_FIELDS - {"font_size"}
+# What the per-type pass still has to check once STRUCTURE_FIELDS passed
+REMAINING_FIELDS = TEXT_SETTING_FIELDS - STRUCTURE_FIELDS
+
+
+def _freeze_settings(value: Any) -> Hashable:
+    """Hashable snapshot of a settings tree that keeps every value's type.
+    Types are kept because the rules distinguish them (70 vs 70.0, list vs tuple).
+
+    Raises:
+        TypeError: If the tree holds a value that cannot be hashed
+    """
+    value_type = type(value)
+    if value_type is dict:
+        return (dict, frozenset((k, _freeze_settings(v)) for k, v in value.items()))
+    if value_type is list or value_type is tuple:
+        return (value_type, tuple(_freeze_settings(v) for v in value))
+    return (value_type, value)
+
 
 class SettingsValidator:
     """Validates all settings operations against defined rules and constants."""
@@ -14,6 +45,25 @@ class SettingsValidator:
         # Resolve fonts directory relative to package root to avoid CWD issues
         self.fonts_dir = BASE_DIR / "assets" / "fonts"
         self.VALID_TEXT_TYPES = VALID_TEXT_TYPES
+        # (fonts_dir, names of its entries), filled on the first font check
+        self._fonts_cache: Optional[Tuple[Path, FrozenSet[str]]] = None
+        # Frozen snapshots of settings blocks that passed validate_settings
+        self._valid_cache: Dict[Hashable, bool] = {}
+
+        # Per text type: required color keys ('text' first), as a set, and
+        # the error message naming them
+        self._color_keys_sorted: Dict[str, Tuple[str, ...]] = {}
+        self._color_keys_set: Dict[str, FrozenSet[str]] = {}
+        self._color_keys_error: Dict[str, str] = {}
+        for text_type, info in self.VALID_TEXT_TYPES.items():
+            required_keys = info["required_color_keys"]
+            sorted_keys = ("text",) + tuple(k for k in required_keys if k != "text")
+            sorted_keys_str = "{'" + "', '".join(sorted_keys) + "'}"
+            self._color_keys_sorted[text_type] = sorted_keys
+            self._color_keys_set[text_type] = frozenset(required_keys)
+            self._color_keys_error[text_type] = (
+                f"Each color must contain exactly: {sorted_keys_str} for type '{text_type}'"
+            )
 
     def validate_settings(self, settings: Dict) -> bool:
         """Validate complete settings block.
@@ -27,34 +77,47 @@ class SettingsValidator:
         Raises:
             ValueError: With specific validation error
         """
+        # Validation is pure apart from the font listing, so a block already
+        # seen as valid passes again. Only successes are remembered.
+        try:
+            cache_key = (self.fonts_dir, _freeze_settings(settings))
+        except TypeError:
+            cache_key = None
+        if cache_key is not None and cache_key in self._valid_cache:
+            return True
+
         # Check exact required keys exist
-        required_keys = {"base_settings", "text_settings"}
-        settings_keys = set(settings.keys())
+        settings_keys = settings.keys()
 
         # Check for missing required keys
-        if missing := (required_keys - settings_keys):
+        if missing := (SETTINGS_SECTION_KEYS - settings_keys):
             raise ValueError(f"Missing required settings sections: {missing}")
 
         # Check for extra unexpected keys
-        if extra := (settings_keys - required_keys):
+        if extra := (settings_keys - SETTINGS_SECTION_KEYS):
             raise ValueError(f"Unexpected settings sections found: {extra}")
 
-        # First validate text_settings structure and required fields
-        for text_type, type_settings in settings["text_settings"].items():
-            required_fields = ["colors", "font", "margins", "position", "style_type", "style_value"]
-            missing_fields = [field for field in required_fields if field not in type_settings]
-            if missing_fields:
-                raise ValueError(f"Missing required settings for text type '{text_type}': {', '.join(missing_fields)}")
+        base_settings = settings["base_settings"]
+        text_settings = settings["text_settings"]
+
+        # First check every text type has its required fields
+        for text_type, type_settings in text_settings.items():
+            self._validate_required_fields(text_type, type_settings, STRUCTURE_FIELDS)
 
         # Then validate base_settings and default_text_type
-        self.validate_base_settings(settings["base_settings"])
-        default_type = settings["base_settings"]["default_text_type"]
-        if default_type not in settings["text_settings"]:
+        self.validate_base_settings(base_settings)
+        default_type = base_settings["default_text_type"]
+        if default_type not in text_settings:
             raise ValueError(f"Default text type '{default_type}' not found in text_settings")
 
-        # Finally do detailed validation of each section
-        self.validate_text_settings(settings["text_settings"])
+        # Finally do detailed validation of each text type
+        self.validate_text_settings(text_settings, REMAINING_FIELDS)
 
+        if cache_key is not None:
+            if len(self._valid_cache) >= VALIDATION_CACHE_SIZE:
+                # Drop the oldest entry
+                del self._valid_cache[next(iter(self._valid_cache))]
+            self._valid_cache[cache_key] = True
         return True
 
     def validate_base_settings(self, base_settings: Dict) -> bool:
@@ -70,8 +133,7 @@ class SettingsValidator:
             ValueError: With specific validation error
         """
         # Check only default_text_type exists
-        allowed_keys = {"default_text_type"}
-        if extra := (set(base_settings.keys()) - allowed_keys):
+        if extra := (base_settings.keys() - BASE_SETTINGS_KEYS):
             raise ValueError(f"Unexpected keys in base_settings: {extra}")
 
         # Check default_text_type exists and is valid
@@ -85,11 +147,17 @@ class SettingsValidator:
 
         return True
 
-    def validate_text_settings(self, text_settings: Dict) -> bool:
+    def validate_text_settings(
+        self,
+        text_settings: Dict,
+        required_fields: FrozenSet[str] = TEXT_SETTING_FIELDS,
+    ) -> bool:
         """Validate text settings section.
 
         Args:
             text_settings: Text settings dictionary
+            required_fields: Fields each text type must have, all text setting
+                fields by default
 
         Returns:
             bool: True if valid
@@ -107,7 +175,7 @@ class SettingsValidator:
                 raise ValueError(f"Invalid text type: {text_type}")
 
             # Check required fields first
-            self._validate_required_fields(text_type, settings)
+            self._validate_required_fields(text_type, settings, required_fields)
 
             # Then validate each field
             self._validate_font_size(text_type, settings)
@@ -124,27 +192,23 @@ class SettingsValidator:
 
         return True
 
-    def _validate_required_fields(self, text_type: str, settings: Dict) -> None:
+    def _validate_required_fields(
+        self,
+        text_type: str,
+        settings: Dict,
+        required_fields: FrozenSet[str] = TEXT_SETTING_FIELDS,
+    ) -> None:
         """Validate that all required fields exist for a text type.
 
         Args:
             text_type: The type of text being validated
             settings: Settings dictionary for this text type
+            required_fields: Fields to check for, all text setting fields by default
 
         Raises:
             ValueError: If any required fields are missing
         """
-        required_fields = {
-            "font_size",
-            "font",
-            "style_type",
-            "style_value",
-            "colors",
-            "position",
-            "margins",
-        }
-
-        missing_fields = required_fields - set(settings.keys())
+        missing_fields = [field for field in required_fields if field not in settings]
         if missing_fields:
             raise ValueError(
                 f"Missing required settings for text type '{text_type}': {', '.join(sorted(missing_fields))}"
@@ -163,31 +227,42 @@ class SettingsValidator:
         if not isinstance(font, str):
             raise ValueError(f"Invalid font for {text_type}: must be string")
 
-        # Validate basic format
-        if not font.startswith("assets.fonts.") or not font.endswith(".ttf"):
+        # Validate basic format: assets.fonts.fontname.ttf
+        prefix, extension = "assets.fonts.", ".ttf"
+        if not font.startswith(prefix) or not font.endswith(extension):
             raise ValueError(f"Invalid font path format for {text_type}: {font}")
 
-        # Split into meaningful parts: assets.fonts.fontname.ttf
-        parts = font.split(".")
-        if len(parts) != 4:  # We expect exactly 4 parts
+        # The name sits between prefix and extension and holds no further dots;
+        # too short a path means the prefix and extension overlap
+        font_name = font[len(prefix) : -len(extension)]
+        if len(font) < len(prefix) + len(extension) or "." in font_name:
             raise ValueError(f"Invalid font path structure for {text_type}: {font}")
-
-        base, fonts_dir, font_name, extension = parts
-
-        # Validate each part
-        if base != "assets":
-            raise ValueError(f"Font path must start with 'assets': {font}")
-        if fonts_dir != "fonts":
-            raise ValueError(f"Font path must be in 'fonts' directory: {font}")
         if not font_name:
             raise ValueError(f"Font name cannot be empty: {font}")
-        if extension != "ttf":
-            raise ValueError(f"Font must be TTF format: {font}")
 
-        # Check if font file actually exists
-        font_path = self.fonts_dir / f"{font_name}.{extension}"
-        if not font_path.exists():
-            raise ValueError(f"Font file does not exist: {font_name}.{extension}")
+        # Check if font file actually exists, re-listing once in case it was just added
+        font_file = font_name + extension
+        if font_file not in self._font_files():
+            self.refresh_fonts()
+            if font_file not in self._font_files():
+                raise ValueError(f"Font file does not exist: {font_file}")
+
+    def _font_files(self) -> FrozenSet[str]:
+        """Return the entry names of the fonts directory, cached until refresh_fonts()"""
+        if self._fonts_cache is None or self._fonts_cache[0] != self.fonts_dir:
+            try:
+                with os.scandir(self.fonts_dir) as it:
+                    names = frozenset(entry.name for entry in it)
+            except FileNotFoundError:
+                names = frozenset()
+            self._fonts_cache = (self.fonts_dir, names)
+        return self._fonts_cache[1]
+
+    def refresh_fonts(self) -> None:
+        """Forget the cached font listing, e.g. after adding fonts"""
+        self._fonts_cache = None
+        # Earlier results may rest on fonts that are gone now
+        self._valid_cache.clear()
 
     def _validate_style_type(self, text_type: str, settings: Dict) -> None:
         """Validate style type matches text type."""
@@ -214,22 +289,17 @@ class SettingsValidator:
         if not colors:
             raise ValueError("Colors list cannot be empty")
 
-        required_keys = self.VALID_TEXT_TYPES[text_type]["required_color_keys"]
         # Always put 'text' first, then the other key
-        sorted_required_keys = ["text"] + [k for k in required_keys if k != "text"]
-        required_keys_set = set(required_keys)
-        seen_colors = {}
+        sorted_required_keys = self._color_keys_sorted[text_type]
+        required_keys_set = self._color_keys_set[text_type]
+        seen_colors = set()
 
         for color in colors:
             if not isinstance(color, dict):
                 raise ValueError("Each color must be a dictionary")
 
-            if set(color.keys()) != required_keys_set:
-                # Create error message with text first
-                sorted_keys_str = "{'" + "', '".join(sorted_required_keys) + "'}"
-                raise ValueError(
-                    f"Each color must contain exactly: {sorted_keys_str} for type '{text_type}'"
-                )
+            if color.keys() != required_keys_set:
+                raise ValueError(self._color_keys_error[text_type])
 
             for key, value in color.items():
                 if not self._is_valid_hex_color(value):
@@ -237,77 +307,33 @@ class SettingsValidator:
 
             color_combo = tuple(f"{key}={color[key]}" for key in sorted_required_keys)
             if color_combo in seen_colors:
-                first_occurrence = seen_colors[color_combo]
-                error_msg = f"Duplicate color combination found: {', '.join(f'{key}={first_occurrence[key]}' for key in sorted_required_keys)}"
-                raise ValueError(error_msg)
-            seen_colors[color_combo] = color
+                # The combo already holds the "key=value" pairs to report
+                raise ValueError(
+                    f"Duplicate color combination found: {', '.join(color_combo)}"
+                )
+            seen_colors.add(color_combo)
 
         return True
 
     def _is_valid_hex_color(self, color: str) -> bool:
         """Validate hex color format."""
-        if not isinstance(color, str):
-            return False
         # Match exactly: # followed by exactly 6 hex digits (0-9 or A-F)
-        return bool(re.match(r"^#[0-9A-F]{6}$", color))
+        return isinstance(color, str) and HEX_COLOR_RE.match(color) is not None
 
     def _validate_position(self, text_type: str, settings: Dict) -> bool:
         """Validate position settings in both dictionary and tuple formats."""
         position = settings["position"]
 
-        # Handle tuple format
+        # Tuples are partial updates; everything else must be the stored dict form
         if isinstance(position, tuple):
-            if len(position) != 4:
-                raise ValueError(
-                    "Position tuple must have 4 values (vertical, horizontal, v_jitter, h_jitter)"
-                )
-
-            vert, horiz, v_jitter, h_jitter = position
-
-            # Validate vertical position if provided
-            if vert is not None:
-                if not isinstance(vert, tuple) or len(vert) != 2:
-                    raise ValueError("Vertical position must be a tuple of 2 values")
-                if not all(0 <= x <= 1 for x in vert):
-                    raise ValueError("Vertical position values must be between 0 and 1")
-
-                # Add min/max validation for tuple format
-                if vert[0] >= vert[1]:
-                    raise ValueError("Vertical position min must be less than max")
-
-            # Validate horizontal position if provided
-            if horiz is not None:
-                if not isinstance(horiz, tuple) or len(horiz) != 2:
-                    raise ValueError("Horizontal position must be a tuple of 2 values")
-                if not all(0 <= x <= 1 for x in horiz):
-                    raise ValueError(
-                        "Horizontal position values must be between 0 and 1"
-                    )
-
-                # Add min/max validation for tuple format
-                if horiz[0] >= horiz[1]:
-                    raise ValueError("Horizontal position min must be less than max")
-
-            # Validate jitters if provided
-            for jitter in (v_jitter, h_jitter):
-                if jitter is not None:
-                    if not isinstance(jitter, (int, float)) or not 0 <= jitter <= 0.5:
-                        raise ValueError("Jitter must be between 0 and 0.5")
-
-            return True
+            return self._validate_position_tuple(position)
 
         # Handle dictionary format
         if not isinstance(position, dict):
             raise ValueError("Position must be either a tuple or dictionary")
 
-        required_keys = {
-            "vertical",
-            "horizontal",
-            "vertical_jitter",
-            "horizontal_jitter",
-        }
-        if set(position.keys()) != required_keys:
-            raise ValueError(f"Position must contain exactly: {required_keys}")
+        if position.keys() != POSITION_KEYS:
+            raise ValueError(f"Position must contain exactly: {set(POSITION_KEYS)}")
 
         # Validate ranges and min/max order
         for key in ["vertical", "horizontal"]:
@@ -329,51 +355,62 @@ class SettingsValidator:
 
         return True
 
-    def _validate_margins(self, text_type: str, settings: Dict) -> bool:
-        """Validate margin settings in both dictionary and tuple formats."""
-        margins = settings["margins"]
+    def _validate_position_tuple(self, position: tuple) -> bool:
+        """Validate a (vertical, horizontal, v_jitter, h_jitter) position tuple."""
+        if len(position) != 4:
+            raise ValueError(
+                "Position tuple must have 4 values (vertical, horizontal, v_jitter, h_jitter)"
+            )
 
-        # Handle tuple format
-        if isinstance(margins, tuple):
-            if len(margins) != 4:
-                raise ValueError(
-                    "Margins tuple must have 4 values (top, bottom, left, right)"
-                )
+        vert, horiz, v_jitter, h_jitter = position
 
-            top, bottom, left, right = margins
+        # Validate vertical position if provided
+        if vert is not None:
+            if not isinstance(vert, tuple) or len(vert) != 2:
+                raise ValueError("Vertical position must be a tuple of 2 values")
+            if not all(0 <= x <= 1 for x in vert):
+                raise ValueError("Vertical position values must be between 0 and 1")
 
-            # Validate each provided margin
-            for margin in margins:
-                if margin is not None:
-                    if not isinstance(margin, (int, float)) or not 0 <= margin < 1:
-                        raise ValueError("Each margin must be between 0 and 1")
+            # Add min/max validation for tuple format
+            if vert[0] >= vert[1]:
+                raise ValueError("Vertical position min must be less than max")
 
-            # Check vertical margins sum if both provided
-            if top is not None and bottom is not None:
-                if top + bottom >= 1:
-                    raise ValueError(
-                        "Sum of top and bottom margins must be less than 1"
-                    )
+        # Validate horizontal position if provided
+        if horiz is not None:
+            if not isinstance(horiz, tuple) or len(horiz) != 2:
+                raise ValueError("Horizontal position must be a tuple of 2 values")
+            if not all(0 <= x <= 1 for x in horiz):
+                raise ValueError("Horizontal position values must be between 0 and 1")
 
-            # Check horizontal margins sum if both provided
-            if left is not None and right is not None:
-                if left + right >= 1:
-                    raise ValueError(
-                        "Sum of left and right margins must be less than 1"
-                    )
+            # Add min/max validation for tuple format
+            if horiz[0] >= horiz[1]:
+                raise ValueError("Horizontal position min must be less than max")
 
-            return True
+        # Validate jitters if provided
+        for jitter in (v_jitter, h_jitter):
+            if jitter is not None:
+                if not isinstance(jitter, (int, float)) or not 0 <= jitter <= 0.5:
+                    raise ValueError("Jitter must be between 0 and 0.5")
+
+        return True
+
+    def _validate_margins(self, text_type: str, settings: Dict) -> bool:
+        """Validate margin settings in both dictionary and tuple formats."""
+        margins = settings["margins"]
+
+        # Tuples are partial updates; everything else must be the stored dict form
+        if isinstance(margins, tuple):
+            return self._validate_margins_tuple(margins)
 
         # Handle dictionary format
         if not isinstance(margins, dict):
             raise ValueError("Margins must be either a tuple or dictionary")
 
-        required_keys = {"top", "bottom", "left", "right"}
-        if set(margins.keys()) != required_keys:
-            raise ValueError(f"Margins must contain exactly: {required_keys}")
+        if margins.keys() != MARGIN_KEYS:
+            raise ValueError(f"Margins must contain exactly: {set(MARGIN_KEYS)}")
 
         # Validate individual margins
-        for key in required_keys:
+        for key in MARGIN_KEYS:
             if not isinstance(margins[key], (int, float)) or not 0 <= margins[key] < 1:
                 raise ValueError(f"{key} margin must be between 0 and 1")
 
@@ -386,6 +423,33 @@ class SettingsValidator:
 
         return True
 
+    def _validate_margins_tuple(self, margins: tuple) -> bool:
+        """Validate a (top, bottom, left, right) margins tuple."""
+        if len(margins) != 4:
+            raise ValueError(
+                "Margins tuple must have 4 values (top, bottom, left, right)"
+            )
+
+        top, bottom, left, right = margins
+
+        # Validate each provided margin
+        for margin in margins:
+            if margin is not None:
+                if not isinstance(margin, (int, float)) or not 0 <= margin < 1:
+                    raise ValueError("Each margin must be between 0 and 1")
+
+        # Check vertical margins sum if both provided
+        if top is not None and bottom is not None:
+            if top + bottom >= 1:
+                raise ValueError("Sum of top and bottom margins must be less than 1")
+
+        # Check horizontal margins sum if both provided
+        if left is not None and right is not None:
+            if left + right >= 1:
+                raise ValueError("Sum of left and right margins must be less than 1")
+
+        return True
+
     def _validate_position_margins_compatibility(
         self, text_type: str, settings: Dict
     ) -> None:
@@ -35,7 +35,7 @@ class ImageManager:
             st.error(f"Image not found: {image_path}")
             return
             
-        if image_path.suffix not in self.valid_extensions:
+        if image_path.suffix.lower() not in self.valid_extensions:
             st.error(f"Invalid image type: {image_path.suffix}")
             return
             
@@ -1,11 +1,12 @@
 from pathlib import Path
+import copy
 import json
 import streamlit as st  # type: ignore
 from content_manager.settings.settings_constants import (
     DEFAULT_TEMPLATE,
     VALID_TEXT_TYPES,
 )
-from typing import List, Dict, Any, Set
+from typing import List, Dict, Any, Optional, Set
 from content_manager.metadata.metadata_editor import MetadataEditor
 from content_manager.metadata.metadata import Metadata
 from content_manager.settings.settings_handler import Settings
@@ -13,6 +14,22 @@ from content_manager.captions import CaptionsHelper
 from config.logging import logger
 
 
+def _update_path(data: Optional[Dict], path: tuple, value: Any) -> Dict:
+    """Return a copy of data with value set at path.
+
+    Only the dicts along path are copied; every other subtree is shared with
+    data, which is left untouched.
+    """
+    root = dict(data) if data else {}
+    node = root
+    for key in path[:-1]:
+        child = node.get(key)
+        node[key] = dict(child) if child else {}
+        node = node[key]
+    node[path[-1]] = value
+    return root
+
+
 class InterfaceSettingsManager:
     """Manages interface settings and state
 
@@ -42,33 +59,77 @@ class InterfaceSettingsManager:
         self.metadata_data = metadata_data
         self.metadata_editor = metadata_editor
         self.settings_handler = settings_handler
-        # Create font mapping on init
-        self.fonts = {
-            font_name: self.settings_handler.load_font(font_name)
-            for font_name in self.settings_handler.list_fonts()
-        }
+        # Settings resolved per (image, settings_source, content_type, product).
+        # Streamlit builds a new manager on every rerun, so entries never outlive
+        # the metadata they were read from; _save_metadata() clears them.
+        self._settings_cache: Dict[tuple, Optional[Dict]] = {}
+        # Default and content type settings read at most once per render
+        self._default_settings_cache: Optional[Dict] = None
+        self._content_settings_cache: Dict[str, Optional[Dict]] = {}
+        self._index_products()
+        self._index_product_groups()
+        self._index_images()
+        # Font names are listed on init; paths are loaded when a font is picked
+        self._font_paths: Dict[str, str] = {}
+        self._font_names = self.settings_handler.list_fonts()
+        self._font_index = {name: i for i, name in enumerate(self._font_names)}
         self.initialize_session_state()
 
-    def initialize_session_state(self):
-        """Initialize or reset the session state with required defaults"""
-        # Find first non-empty content type and its first image
-        first_image = None
-        first_content_type = None
-        
+    def _index_products(self) -> None:
+        """Index product names per content type; rerun after renaming products"""
+        self._products_by_type: Dict[str, List[str]] = {
+            content_type: [p["name"] for p in product_list]
+            for content_type, product_list in self.metadata_data.get("products", {}).items()
+        }
+        self._product_set_by_type: Dict[str, Set[str]] = {
+            content_type: set(names)
+            for content_type, names in self._products_by_type.items()
+        }
+
+    def _index_product_groups(self) -> None:
+        """Map (content_type, product) to the first settings group listing the product"""
+        self._product_to_group: Dict[tuple, str] = {}
+        for content_type, ct_settings in self.metadata_data.get("settings", {}).items():
+            for group in ct_settings:
+                if group == "content":
+                    continue
+                for product in group[1:-1].split(","):
+                    self._product_to_group.setdefault((content_type, product.strip()), group)
+
+    def _index_images(self) -> None:
+        """Index images per content type and find the first content type with images"""
+        self._content_types_ordered = tuple(self.content_types)
+        self._images_by_type: Dict[str, List[str]] = {
+            content_type: self.metadata_data["structure"][content_type]["images"]
+            for content_type in self._content_types_ordered
+        }
+        # image -> (content_type, position within that content type)
+        self._image_position: Dict[str, tuple] = {}
+        for content_type, images in self._images_by_type.items():
+            for i, image in enumerate(images):
+                self._image_position.setdefault(image, (content_type, i))
+
         # Look through all content types to find the first one with images
-        for content_type in self.content_types:
-            available_images = self.metadata_data["structure"][content_type]["images"]
+        self._first_nonempty_type = None
+        self._first_image = None
+        for content_type, available_images in self._images_by_type.items():
             if available_images:
-                first_content_type = content_type
-                first_image = available_images[0]
+                self._first_nonempty_type = content_type
+                self._first_image = available_images[0]
                 break
+
+    def initialize_session_state(self):
+        """Initialize or reset the session state with required defaults"""
+        # First non-empty content type and its first image
+        first_image = self._first_image
+        first_content_type = self._first_nonempty_type
         
         # Initialize content type states
         if "settings_content_type" not in st.session_state:
-            st.session_state.settings_content_type = first_content_type or next(iter(self.content_types))
+            st.session_state.settings_content_type = first_content_type or self._content_types_ordered[0]
             
         if "content_type" not in st.session_state:
-            st.session_state.content_type = first_content_type or next(iter(self.content_types))
+            st.session_state.content_type = first_content_type or self._content_types_ordered[0]
         
         # Initialize selected image
         if "selected_image" not in st.session_state or not st.session_state.selected_image:
@@ -78,11 +139,10 @@ class InterfaceSettingsManager:
         if "nav_index" not in st.session_state:
             if first_image:
                 content_type = st.session_state.content_type
-                images = self.metadata_data["structure"][content_type]["images"]
-                if st.session_state.selected_image in images:
-                    st.session_state.nav_index = images.index(st.session_state.selected_image)
-                else:
-                    st.session_state.nav_index = 0
+                image_type, position = self._image_position.get(
+                    st.session_state.selected_image, (None, 0)
+                )
+                st.session_state.nav_index = position if image_type == content_type else 0
             else:
                 st.session_state.nav_index = 0
 
@@ -118,7 +178,7 @@ class InterfaceSettingsManager:
             # Content type selection remains the same
             st.selectbox(
                 label="Content Type Selection",
-                options=self.content_types,
+                options=self._content_types_ordered,
                 key="settings_content_type",
                 on_change=self.handle_content_type_change,
                 label_visibility="visible",
@@ -135,10 +195,7 @@ class InterfaceSettingsManager:
             content_type = st.session_state.settings_content_type
             
             # Get valid products for this content type from metadata
-            valid_products = [
-                p["name"] 
-                for p in self.metadata_data["products"][content_type]
-            ] if content_type in self.metadata_data["products"] else []
+            valid_products = self._products_by_type.get(content_type, [])
             
             # Create product list with "None" option
             product_list = ["None"] + valid_products
@@ -189,9 +246,8 @@ class InterfaceSettingsManager:
                 label_visibility="visible"
             )
 
-    def render_base_settings(self, settings_data):
+    def render_base_settings(self, current_settings):
         """Render base settings controls"""
-        current_settings = self.get_current_settings()
         if not current_settings:
             st.error("Could not retrieve current settings")
             return
@@ -199,8 +255,8 @@ class InterfaceSettingsManager:
         # Get base settings from the proper location
         base_settings = current_settings.get("base_settings", {})
         current_text_type = base_settings.get("default_text_type")
-        logger.debug(f"{current_text_type=}")
-        logger.debug(f"{base_settings=}")
+        logger.debug("current_text_type=%r", current_text_type)
+        logger.debug("base_settings=%r", base_settings)
         
         if not current_text_type:
             st.error("No text type found in current settings")
@@ -242,7 +298,7 @@ class InterfaceSettingsManager:
     def render_text_settings(self, settings_data):
         """Render text type settings controls"""
         logger.trace("\n=== Text Settings Debug ===")
-        logger.trace(f"Input settings_data: {settings_data}")
+        logger.trace("Input settings_data: %s", settings_data)
 
         with st.expander("Text Type Settings", expanded=True):
             if not settings_data:
@@ -250,60 +306,17 @@ class InterfaceSettingsManager:
                 st.error("No settings data available")
                 return
 
-            # Get current image and metadata
-            current_image = st.session_state.get("selected_image")
-            if not current_image:
-                st.error("No image selected")
-                return
-
-            image_data = self.metadata_data["images"].get(current_image)
-            if not image_data:
-                st.error(f"No metadata found for image: {current_image}")
-                return
-
-            # Get settings source from image data
-            settings_source = image_data.get("settings_source", "default")
-            content_type = image_data.get("content_type")
-            product = image_data.get("product")
-
-            logger.debug(f"Settings resolution - Source: {settings_source}, Content: {content_type}, Product: {product}")
-
-            # Get settings based on source priority (custom > product > content > default)
-            # Be resilient if settings_source says 'custom' but settings are None
-            if settings_source == "custom" and image_data.get("settings"):
-                # Custom settings are stored directly in image_data when present
-                current_settings = {"settings": image_data["settings"]}
-                logger.debug("Using custom settings from image data")
-            elif settings_source == "product" and product:
-                current_settings = self.metadata_editor.get_settings("product", product, content_type)
-                logger.debug(f"Using product settings for {product}")
-            elif settings_source == "content":  # Just check settings_source is "content"
-                current_settings = self.metadata_editor.get_settings("content_type", content_type)
-                logger.debug(f"Using content settings for {content_type}")
-            else:
-                # Default is the fallback
-                current_settings = self.metadata_editor.get_settings("default")
-                logger.debug("Using default settings")
-
-            if not current_settings:
-                logger.debug(f"No valid settings found for source: {settings_source}")
-                st.error("No valid settings found")
-                return
-
-            settings = current_settings.get("settings", {})
-            current_type = settings.get("base_settings", {}).get("default_text_type")
+            # settings_data is already resolved from the image's settings source
+            current_type = settings_data.get("base_settings", {}).get("default_text_type")
             
             if not current_type:
                 logger.trace("DEBUG: No default text type found")
                 st.error("No default text type set")
                 return
 
-            logger.debug(f"{settings_source=}")
-            logger.debug(f"{current_settings=}")
-
-            text_settings = settings.get("text_settings", {}).get(current_type, {})
+            text_settings = settings_data.get("text_settings", {}).get(current_type, {})
             if not text_settings:
-                logger.trace(f"DEBUG: No settings found for type {current_type}")
+                logger.trace("DEBUG: No settings found for type %s", current_type)
                 st.error(f"No settings found for text type: {current_type}")
                 return
 
@@ -343,61 +356,37 @@ class InterfaceSettingsManager:
         with cols[2]:
             st.write(f"Delete {idx + 1}")  # Add number to delete label
             if st.button("🗑️", key=f"delete_color_{text_type}_{idx}"):
-                logger.trace(f"\n=== Deleting Color Pair {idx + 1} ===")
-                logger.trace(f"Removing: {color_pair}")
+                logger.trace("\n=== Deleting Color Pair %s ===", idx + 1)
+                logger.trace("Removing: %s", color_pair)
                 deleted = True
 
         return deleted
 
-    def render_color_settings(self, text_type: str):
+    def render_color_settings(self, text_type: str, settings: Dict):
         """Render and manage complete color settings UI for a text type"""
         # Create notification container at top
 
         logger.trace("\n=== Color Settings Debug ===")
-        logger.trace(f"Text type: {text_type}")
+        logger.trace("Text type: %s", text_type)
+        logger.trace("Settings data retrieved: %s", settings)
 
-        # Get current image and its settings level
-        current_image = st.session_state.get("selected_image")
-        image_data = self.metadata_data["images"][current_image]
-        settings_source = image_data["settings_source"]
-        content_type = image_data["content_type"]
-        product = image_data.get("product")
-
-        logger.trace(f"Current image: {current_image}")
-        logger.trace(f"Settings source: {settings_source}")
-        logger.trace(f"Content type: {content_type}")
-        logger.trace(f"Product: {product}")
-
-        # Get settings based on source level
-        if settings_source == "custom":
-            settings_data = self.metadata_editor.get_settings("custom", current_image)
-        elif settings_source == "product" and product:
-            settings_data = self.metadata_editor.get_settings(
-                "product", product, content_type
-            )
-        elif settings_source == "content_type":
-            settings_data = self.metadata_editor.get_settings(
-                "content_type", content_type
-            )
-        else:
-            settings_data = self.metadata_editor.get_settings("default")
-
-        logger.trace(f"Settings data retrieved: {settings_data}")
-
-        settings = settings_data.get("settings", {})
         if not settings:
             st.warning("No settings available")
             return
 
         text_settings = settings.get("text_settings", {})
-        logger.trace(f"Text settings found: {text_settings}")
+        logger.trace("Text settings found: %s", text_settings)
 
         # Rest of the function stays the same
         current_type_settings = text_settings.get(text_type, {})
-        logger.trace(f"Current type settings: {current_type_settings}")
+        logger.trace("Current type settings: %s", current_type_settings)
 
         colors = current_type_settings.get("colors", [])
-        logger.trace(f"Colors found: {colors}")
+        logger.trace("Colors found: %s", colors)
+
+        # Metadata is reloaded every rerun, so this is what is on disk
+        # before the color pickers below write into the pairs
+        saved_colors = json.dumps(colors, sort_keys=True)
 
         with st.expander("Color Settings", expanded=False):
             # Display existing color pairs
@@ -420,14 +409,23 @@ class InterfaceSettingsManager:
                     if colors:
                         new_pair = {k: "#FFFFFF" for k in colors[0].keys()}
                         colors.append(new_pair)
-                        logger.trace(f"\n=== Adding New Color Pair ===")
-                        logger.trace(f"New pair: {new_pair}")
+                        logger.trace("\n=== Adding New Color Pair ===")
+                        logger.trace("New pair: %s", new_pair)
                         self._save_color_settings(settings)
                         st.rerun()
 
             with cols[1]:
                 if st.button("Save Colors", key=f"save_colors_{text_type}"):
-                    if self._save_color_settings(settings):
+                    image_data = self.metadata_data["images"].get(
+                        st.session_state.get("selected_image"), {}
+                    )
+                    if (
+                        image_data.get("settings_source") == "custom"
+                        and json.dumps(colors, sort_keys=True) == saved_colors
+                    ):
+                        # Nothing changed - skip the metadata write and rerun
+                        st.session_state.show_success = True
+                    elif self._save_color_settings(settings):
                         st.session_state.show_success = True
                         st.rerun()
 
@@ -451,7 +449,7 @@ class InterfaceSettingsManager:
             # Get keys from first color entry
             return list(colors[0].keys())
 
-        logger.trace(f"Warning: No existing color keys found for {text_type}")
+        logger.trace("Warning: No existing color keys found for %s", text_type)
         return []
 
     def _save_color_settings(self, settings_data: dict):
@@ -467,7 +465,7 @@ class InterfaceSettingsManager:
             self.metadata_data["images"][current_image]["settings"] = settings_data
 
             # Save metadata to disk
-            self.metadata.save()
+            self._save_metadata()
             st.success("Color settings saved successfully")
             return True
 
@@ -496,10 +494,10 @@ class InterfaceSettingsManager:
                     return
 
                 settings_source = image_data.get("settings_source", "default")
-                logger.debug(f"RENDER DEBUG - Current image: {current_image}")
-                logger.debug(f"RENDER DEBUG - Settings source: {settings_source}")
-                logger.debug(f"RENDER DEBUG - Image data: {image_data}")
-                logger.debug(f"RENDER DEBUG - Current settings: {current_settings}")
+                logger.debug("RENDER DEBUG - Current image: %s", current_image)
+                logger.debug("RENDER DEBUG - Settings source: %s", settings_source)
+                logger.debug("RENDER DEBUG - Image data: %s", image_data)
+                logger.debug("RENDER DEBUG - Current settings: %s", current_settings)
 
                 if current_settings:
                     settings_data = current_settings  # The settings are already at the right level
@@ -516,7 +514,7 @@ class InterfaceSettingsManager:
                         st.warning("No default text type set")
                         return
 
-                    self.render_color_settings(text_type)
+                    self.render_color_settings(text_type, settings_data)
                     self.render_preview_expander(settings_data)
 
                     # Debug view of settings
@@ -548,48 +546,88 @@ class InterfaceSettingsManager:
                 return None
 
             settings_source = image_data.get("settings_source", "default")
-            logger.debug(f"SETTINGS DEBUG - Image: {current_image}")
-            logger.debug(f"SETTINGS DEBUG - Raw image data: {image_data}")
-            logger.debug(f"SETTINGS DEBUG - Settings source: {settings_source}")
-
-            # If settings_source is content, get content type settings
-            if settings_source == "content":
-                content_type = image_data.get("content_type")
-                logger.debug(f"SETTINGS DEBUG - Getting content type settings for: {content_type}")
-                content_settings = self.metadata_editor.get_settings("content_type", content_type)
-                logger.debug(f"SETTINGS DEBUG - Content settings retrieved: {content_settings}")
-                if content_settings:
-                    return content_settings.get("settings")
-                logger.error(f"No content type settings found for {content_type}")
-
-            # If image has no settings, or settings_source is default, fall back
-            if image_data.get("settings") is None or settings_source == "default":
-                logger.debug("SETTINGS DEBUG - Getting default settings")
-                default_result = self.metadata_editor.get_settings("default")
-                logger.debug(f"SETTINGS DEBUG - Default settings result: {default_result}")
-                
-                if not default_result:
-                    logger.error("Failed to get default settings")
-                    return None
-                    
-                settings = default_result.get("settings")
-                logger.debug(f"SETTINGS DEBUG - Extracted settings from default: {settings}")
-                return settings
-
-            # For all other cases, return the stored settings
-            logger.debug(f"SETTINGS DEBUG - Returning stored settings: {image_data.get('settings')}")
-            
-            return image_data.get("settings")
+            logger.debug("SETTINGS DEBUG - Image: %s", current_image)
+            logger.debug("SETTINGS DEBUG - Raw image data: %s", image_data)
+            logger.debug("SETTINGS DEBUG - Settings source: %s", settings_source)
+
+            # Render steps ask for the same image's settings several times
+            cache_key = (
+                current_image,
+                settings_source,
+                image_data.get("content_type"),
+                image_data.get("product"),
+            )
+            if cache_key not in self._settings_cache:
+                settings = self.metadata_editor.get_settings_bulk(
+                    [current_image], default_loader=self._default_template_settings
+                )[current_image]
+                # The editing widgets write into these settings before saving them
+                # as the image's custom settings, so only an image's own custom
+                # settings may be handed out without a copy
+                if settings_source != "custom":
+                    settings = copy.deepcopy(settings)
+                self._settings_cache[cache_key] = settings
+            return self._settings_cache[cache_key]
 
         except Exception as e:
             logger.error(f"Error getting settings: {str(e)}")
             logger.error(f"Full exception: {str(e.__class__.__name__)}: {str(e)}")
             return None
 
+    def _default_template_settings(self) -> Dict:
+        """Parse the default template from text kept in session state across reruns.
+
+        The text is reread only when the template file's mtime changes. Each
+        call parses a fresh dict, since callers edit the settings they get in
+        place before saving them as custom settings.
+        """
+        try:
+            template = Path(DEFAULT_TEMPLATE)
+            mtime = template.stat().st_mtime_ns
+            cached = st.session_state.get("_default_template")
+            if cached is None or cached[0] != mtime:
+                cached = (mtime, template.read_text())
+                st.session_state["_default_template"] = cached
+            return json.loads(cached[1])
+        except (IOError, json.JSONDecodeError) as e:
+            raise ValueError(f"Failed to load default template: {str(e)}")
+
+    def _get_default_settings(self) -> Dict:
+        """Default template settings, parsed once; copy before editing them"""
+        if self._default_settings_cache is None:
+            self._default_settings_cache = self._default_template_settings()
+        return self._default_settings_cache
+
+    def _get_content_type_settings(self, content_type: str) -> Optional[Dict]:
+        """Settings stored for a content type, looked up once per content type"""
+        if content_type not in self._content_settings_cache:
+            self._content_settings_cache[content_type] = self.metadata_editor.get_settings(
+                "content_type", content_type
+            )["settings"]
+        return self._content_settings_cache[content_type]
+
+    def _load_font(self, font_name: str) -> str:
+        """Font path for a font name, loaded through the settings handler once"""
+        if font_name not in self._font_paths:
+            self._font_paths[font_name] = self.settings_handler.load_font(font_name)
+        return self._font_paths[font_name]
+
+    def refresh(self) -> None:
+        """Drop cached settings so the next lookups read them again"""
+        self._settings_cache.clear()
+        self._default_settings_cache = None
+        self._content_settings_cache.clear()
+        self._index_product_groups()
+
+    def _save_metadata(self) -> None:
+        """Save metadata to disk, dropping settings resolved before the change"""
+        self.refresh()
+        self.metadata.save()
+
     def handle_text_type_change(self, new_text_type: str):
         """Handle changing text type in settings"""
         logger.debug("\n=== Text Type Change Debug ===")
-        logger.debug(f"1. Starting text type change to: {new_text_type}")
+        logger.debug("1. Starting text type change to: %s", new_text_type)
 
         current_image = st.session_state.selected_image
         if not current_image:
@@ -599,44 +637,45 @@ class InterfaceSettingsManager:
         # Get current settings
         image_data = self.metadata_data["images"][current_image]
         settings_source = image_data["settings_source"]
-        logger.debug(f"2. Current settings source: {settings_source}")
+        logger.debug("2. Current settings source: %s", settings_source)
 
         # Get the settings we're currently using
         if settings_source == "content":
             content_type = image_data["content_type"]
             current_settings = self.metadata_data["settings"][content_type]["content"]
-            logger.debug(f"3a. Using content settings for {content_type}")
+            logger.debug("3a. Using content settings for %s", content_type)
         elif settings_source == "product":
             product = image_data["product"]
             content_type = image_data["content_type"]
-            for group, settings in self.metadata_data["settings"][content_type].items():
-                if group != "content":
-                    products = {p.strip() for p in group[1:-1].split(",")}
-                    if product in products:
-                        current_settings = settings
-                        break
-            logger.debug(f"3b. Using product settings for {product}")
+            group = self._product_to_group[(content_type, product)]
+            current_settings = self.metadata_data["settings"][content_type][group]
+            logger.debug("3b. Using product settings for %s", product)
         else:
             current_settings = image_data.get("settings")
             logger.info("3c. Using custom/default settings")
 
-        logger.debug(f"4. Current settings: {current_settings}")
+        logger.debug("4. Current settings: %s", current_settings)
 
-        # Create a copy of current settings
-        settings_data = current_settings.copy() if current_settings else {}
+        # Copy only the paths being changed; the source settings stay untouched
+        settings_data = current_settings or {}
         logger.debug("5. Created settings copy")
         
         # Update settings with new text type
         if new_text_type not in settings_data.get("text_settings", {}):
-            logger.debug(f"6. Adding new text type {new_text_type} settings")
+            logger.debug("6. Adding new text type %s settings", new_text_type)
             # Get default settings for new type
-            default_settings = self.metadata_editor.get_settings(level="default")["settings"]
-            default_type_settings = default_settings["text_settings"][new_text_type]
-            settings_data.setdefault("text_settings", {})[new_text_type] = default_type_settings.copy()
+            default_type_settings = self._get_default_settings()["text_settings"][new_text_type]
+            settings_data = _update_path(
+                settings_data,
+                ("text_settings", new_text_type),
+                copy.deepcopy(default_type_settings),
+            )
 
         # Update default text type
-        settings_data.setdefault("base_settings", {})["default_text_type"] = new_text_type
-        logger.debug(f"7. Updated default text type to {new_text_type}")
+        settings_data = _update_path(
+            settings_data, ("base_settings", "default_text_type"), new_text_type
+        )
+        logger.debug("7. Updated default text type to %s", new_text_type)
 
         # Always switch to custom settings when making changes
         try:
@@ -652,7 +691,7 @@ class InterfaceSettingsManager:
             self.metadata_data["images"][current_image]["settings"] = settings_data
             logger.debug("10. Updated local metadata copy")
 
-            self.metadata.save()
+            self._save_metadata()
             logger.debug("11. Saved metadata to disk")
 
         except Exception as e:
@@ -698,8 +737,8 @@ class InterfaceSettingsManager:
         with cols[0]:
             selected_font = st.selectbox(
                 "Font",
-                options=list(self.fonts.keys()),
-                index=list(self.fonts.keys()).index(current_font_name),
+                options=self._font_names,
+                index=self._font_index[current_font_name],
                 key=f"font_select_{text_type}",
             )
 
@@ -707,7 +746,7 @@ class InterfaceSettingsManager:
             if selected_font != current_font_name:
                 logger.trace(f"\n=== Font Change ===")
                 logger.trace(f"Old font: {text_settings['font']}")
-                new_font = self.fonts[selected_font]
+                new_font = self._load_font(selected_font)
                 logger.trace(f"New font: {new_font}")
 
                 # Update settings with new font
@@ -718,7 +757,7 @@ class InterfaceSettingsManager:
                 self.metadata_editor.edit_image(
                     image_name, {"settings": settings_data, "settings_source": "custom"}
                 )
-                self.metadata.save()
+                self._save_metadata()
                 st.rerun()
 
         # Font size input (keeping the same structure for consistency)
@@ -742,7 +781,7 @@ class InterfaceSettingsManager:
                 self.metadata_editor.edit_image(
                     image_name, {"settings": settings_data, "settings_source": "custom"}
                 )
-                self.metadata.save()
+                self._save_metadata()
                 st.rerun()
 
         # Style value input
@@ -771,7 +810,7 @@ class InterfaceSettingsManager:
                 self.metadata_editor.edit_image(
                     image_name, {"settings": settings_data, "settings_source": "custom"}
                 )
-                self.metadata.save()
+                self._save_metadata()
                 st.rerun()
 
     def _render_position_settings(self, position: dict, current_type: str):
@@ -808,7 +847,7 @@ class InterfaceSettingsManager:
                     )
                     st.session_state.top_bar_message = "changed settings !"
                     st.session_state.top_bar_message_type = "success"
-                    self.metadata.save()
+                    self._save_metadata()
                     st.rerun()
                     
                 except ValueError as e:
@@ -898,7 +937,7 @@ class InterfaceSettingsManager:
                 self.metadata_editor.edit_image(
                     image_name, {"settings": settings_data, "settings_source": "custom"}
                 )
-                self.metadata.save()
+                self._save_metadata()
                 st.rerun()
 
         # Create 4 equal columns
@@ -1088,9 +1127,9 @@ class InterfaceSettingsManager:
                 # Get the settings for the new level BEFORE switching
                 new_settings = None
                 if selected_level == "default":
-                    new_settings = self.metadata_editor.get_settings("default")
+                    new_settings = {"settings": copy.deepcopy(self._get_default_settings())}
                 elif selected_level == "content":
-                    new_settings = self.metadata_editor.get_settings("content_type", content_type)
+                    new_settings = {"settings": self._get_content_type_settings(content_type)}
                 elif selected_level == "product":
                     new_settings = self.metadata_editor.get_settings("product", product, content_type)
                 
@@ -1103,7 +1142,7 @@ class InterfaceSettingsManager:
                             "settings_source": selected_level
                         }
                     )
-                    self.metadata.save()
+                    self._save_metadata()
                     st.rerun()
                 else:
                     st.error(f"Could not load settings for {selected_level} level")
@@ -1161,7 +1200,7 @@ class InterfaceSettingsManager:
             )
 
             # Save metadata
-            self.metadata.save()
+            self._save_metadata()
 
             logger.trace("File moved and metadata updated successfully")
 
@@ -1238,7 +1277,7 @@ class InterfaceSettingsManager:
                 st.session_state.nav_index = 0
                 
             # Save changes
-            self.metadata.save()
+            self._save_metadata()
             
             # Set success message
             st.session_state.top_bar_message = f"Image moved to {new_content_type}"
@@ -1261,7 +1300,7 @@ class InterfaceSettingsManager:
             return True, ""
 
         # Only check if product exists
-        if any(p["name"] == product for p in self.metadata_data["products"][content_type]):
+        if product in self._product_set_by_type[content_type]:
             return True, ""
             
         return False, f"Product '{product}' not found in content type '{content_type}'"
@@ -1369,7 +1408,7 @@ class InterfaceSettingsManager:
             self.metadata_editor.edit_image(current_image, {"product": new_product})
             
             # Save metadata
-            self.metadata.save()
+            self._save_metadata()
             
             # Set success message in top bar
             st.session_state.top_bar_message = f"Product updated to: {new_product or 'None'}"
@@ -1500,7 +1539,7 @@ class InterfaceSettingsManager:
                         # Toggle logic here
                         if product_info:
                             product_info['prevent_duplicates'] = not current_state
-                            self.metadata.save()  # Save changes
+                            self._save_metadata()  # Save changes
                             st.rerun()  # Force UI refresh
             else:
                 st.button(
@@ -135,7 +135,7 @@ class TopBarManager:
             return []
         return [
             f.name for f in content_path.iterdir() 
-            if f.is_file() and f.suffix in VALID_IMAGE_EXTENSIONS
+            if f.is_file() and f.suffix.lower() in VALID_IMAGE_EXTENSIONS
         ]
 
     def prev_image(self):
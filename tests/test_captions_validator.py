@@ -2,8 +2,9 @@ import unittest
 from io import StringIO
 from pathlib import Path
 from tempfile import NamedTemporaryFile
+from unittest.mock import patch
 
-from content_manager.captions import CaptionsValidator
+from content_manager.captions import CaptionsHelper, CaptionsValidator
 
 
 class TestCaptionsValidator(unittest.TestCase):
@@ -485,5 +486,54 @@ class TestCaptionsValidator(unittest.TestCase):
             Path(f.name).unlink()
 
 
+class TestProductMinOccurrences(unittest.TestCase):
+    def _occurrences_both_ways(self, content: str):
+        """Count with the row loop and with the pandas path used for large files"""
+        with NamedTemporaryFile(mode="w", suffix=".csv", delete=False) as f:
+            f.write(content)
+
+        try:
+            row_loop = CaptionsHelper.get_product_min_occurrences(Path(f.name))
+            with patch("content_manager.captions.LARGE_CAPTIONS_FILE_SIZE", 0):
+                vectorized = CaptionsHelper.get_product_min_occurrences(Path(f.name))
+        finally:
+            Path(f.name).unlink()
+
+        return row_loop, vectorized
+
+    def test_vectorized_count_matches_row_loop(self):
+        """Repeated products, blank and quoted empty cells count the same either way"""
+        row_loop, vectorized = self._occurrences_both_ways(
+            "product_hook,hook,product_content,content,product_content,content,product_cta,cta\n"
+            "magnesium,h1,zinc,c1,zinc,c2,swipe,x\n"
+            'magnesium,h2,zinc,c1,vitamin d,c2,,""\n'
+            ',"",,"", "" ,c3, "",x\n'
+            " magnesium ,h3,vitamin d,c1,vitamin d,c2,swipe,y\n"
+        )
+
+        self.assertEqual(vectorized, row_loop)
+        counts = {
+            ct: {p["name"]: p["min_occurrences"] for p in prods}
+            for ct, prods in row_loop.items()
+        }
+        self.assertEqual(
+            counts,
+            {
+                "hook": {"magnesium": 1},
+                "content": {"vitamin d": 2, "zinc": 2},
+                "cta": {"swipe": 1},
+            },
+        )
+
+    def test_vectorized_count_headers_only(self):
+        """A headers-only file yields empty product lists either way"""
+        row_loop, vectorized = self._occurrences_both_ways(
+            "product_hook,hook,product_content,content\n"
+        )
+
+        self.assertEqual(vectorized, row_loop)
+        self.assertEqual(row_loop, {"hook": [], "content": []})
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -38,6 +38,8 @@ Want me to create the first test class structure?
 
 import copy
 import json
+import os
+import tempfile
 import unittest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -168,6 +170,19 @@ class TestMetadata(unittest.TestCase):
             # Check images list exists
             self.assertIn("images", self.metadata.data["structure"][content_type])
 
+    def test_first_save_uses_umask_permissions(self):
+        """Test a new metadata.json gets the same mode open(path, "w") would give"""
+        umask = os.umask(0o022)
+        try:
+            with tempfile.TemporaryDirectory() as tmp:
+                self.metadata.base_path = Path(tmp)
+                self.metadata.save()
+
+                mode = (Path(tmp) / "metadata.json").stat().st_mode & 0o777
+                self.assertEqual(mode, 0o644)
+        finally:
+            os.umask(umask)
+
     def test_product_structure(self):
         """Test product structure"""
         for content_type, products in self.metadata.data["products"].items():
@@ -278,6 +293,24 @@ class TestMetadataEditor(unittest.TestCase):
             self.test_data["images"][image_name]["settings_source"], "custom"
         )
 
+    def test_get_settings_bulk(self):
+        """Test resolving settings for several images at once"""
+        self.test_data["images"]["2h.PNG"]["settings_source"] = "content"
+        self.test_data["images"]["3h.png"]["settings_source"] = "content"
+
+        resolved = self.editor.get_settings_bulk(
+            ["1h.PNG", "2cta.PNG", "2h.PNG", "3h.png", "missing.png"]
+        )
+
+        default = self.editor.get_settings("default")["settings"]
+        self.assertEqual(resolved["1h.PNG"], default)
+        self.assertIs(
+            resolved["2cta.PNG"], self.test_data["images"]["2cta.PNG"]["settings"]
+        )
+        self.assertIs(resolved["2h.PNG"], self.test_data["settings"]["hook"]["content"])
+        self.assertIs(resolved["3h.png"], resolved["2h.PNG"])
+        self.assertIsNone(resolved["missing.png"])
+
     @patch("content_manager.metadata.metadata_editor.Path")
     def test_move_untagged_image(self, MockPath):
         """Test moving image between content types"""
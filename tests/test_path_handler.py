@@ -3,6 +3,7 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest.mock import patch
 
 from content_manager.path_handler import PathValidator
 
@@ -371,6 +372,19 @@ class TestPathValidator(unittest.TestCase):
         self.assertIn("[content/1.PNG, cta/1.jpg, hook/1.png]", error_msg)
         self.assertIn("[2.png, hook/2.PNG]", error_msg)
 
+    def test_duplicate_image_names_skip_non_image_base_files(self):
+        """Base folder files with an image extension but no image content are not counted"""
+        for folder in ["hook", "content", "cta"]:
+            (self.temp_dir / folder).mkdir()
+
+        png_header = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+        with open(self.temp_dir / "hook" / "hook1.png", "wb") as f:
+            f.write(png_header)
+        with open(self.temp_dir / "hook1.png", "w") as f:
+            f.write("not an image")
+
+        self.assertTrue(self.validator._check_duplicate_image_names(self.temp_dir))
+
     def test_duplicate_image_content_not_allowed(self):
         """Should fail if identical images exist with different names"""
         # Create test structure
@@ -439,6 +453,28 @@ class TestPathValidator(unittest.TestCase):
         self.assertEqual(len(self.validator.errors), 0)
         self.assertEqual(len(self.validator.warnings), 0)
 
+    def test_folder_validation_reuses_result_until_folders_change(self):
+        """Should reuse a passing result for an unchanged tree and rerun after changes"""
+        for i, content_type in enumerate(sorted(self.validator.content_types)):
+            folder = self.temp_dir / content_type
+            folder.mkdir()
+            with open(folder / f"{content_type}.png", "wb") as f:
+                f.write(b"\x89PNG\r\n\x1a\n" + bytes([i]))
+
+        self.assertTrue(self.validator.folder_validation(self.temp_dir))
+        self.assertEqual(len(self.validator._result_cache), 1)
+
+        # Unchanged tree - the cached checks are not run again
+        with patch.object(self.validator, "_run_folder_checks") as run_checks:
+            self.assertTrue(self.validator.folder_validation(self.temp_dir))
+            run_checks.assert_not_called()
+
+        # A new duplicate changes the fingerprint, so the checks run again
+        shutil.copy(self.temp_dir / "hook" / "hook.png", self.temp_dir / "cta" / "copy.png")
+        with self.assertRaises(ValueError) as context:
+            self.validator.folder_validation(self.temp_dir)
+        self.assertIn("Duplicate images found", str(context.exception))
+
     def test_strict_mode_converts_warnings_to_errors(self):
         """Should treat warnings as errors in strict mode"""
         # Create base structure
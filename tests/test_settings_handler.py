@@ -1661,8 +1661,8 @@ class TestApplySettings(unittest.TestCase):
             expected_calls, any_order=True
         )
 
-        # Verify metadata was saved
-        self.settings.metadata.save.assert_called()
+        # Verify metadata was saved once for the whole batch
+        self.settings.metadata.save.assert_called_once()
 
     def test_bulk_apply_settings_existing_settings(self):
         """Test bulk apply when settings already exist."""
@@ -2019,6 +2019,22 @@ class TestApplySettings(unittest.TestCase):
         )
         self.assertIn("Invalid settings structure", str(context.exception))
 
+    def test_bulk_edit_defers_save_until_outermost_exit(self):
+        """Test bulk_edit saves metadata once when the outermost block exits"""
+        self.settings.metadata = MagicMock()
+
+        with self.settings.bulk_edit():
+            self.settings._mark_dirty_or_save()
+            with self.settings.bulk_edit():
+                self.settings._mark_dirty_or_save()
+            self.settings.metadata.save.assert_not_called()
+
+        self.settings.metadata.save.assert_called_once()
+
+        # Outside a block every change is saved immediately
+        self.settings._mark_dirty_or_save()
+        self.assertEqual(self.settings.metadata.save.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
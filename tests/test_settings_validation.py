@@ -1,5 +1,6 @@
 import copy
 import json
+import tempfile
 import unittest
 from pathlib import Path
 
@@ -32,6 +33,16 @@ class TestSettingsValidator(unittest.TestCase):
         self.valid_test_settings = json.loads(DEFAULT_TEMPLATE)
         assert self.validator.validate_settings(self.valid_test_settings) is True
 
+    def test_repeated_validation_still_sees_changes(self):
+        """Test a block validated once is re-checked after it is modified."""
+        settings = json.loads(DEFAULT_TEMPLATE)
+        assert self.validator.validate_settings(settings) is True
+        assert self.validator.validate_settings(settings) is True
+
+        settings["text_settings"]["plain"]["font_size"] = 70.0
+        with pytest.raises(ValueError, match="Invalid font size"):
+            self.validator.validate_settings(settings)
+
     def test_extra_sections(self):
         """Test extra unexpected sections."""
         settings = json.loads(DEFAULT_TEMPLATE)
@@ -102,6 +113,18 @@ class TestSettingsValidator(unittest.TestCase):
                 with self.assertRaises(ValueError):
                     self.validator._validate_font(**settings)
 
+    def test_font_validation_sees_fonts_added_later(self):
+        """Test a font added after the fonts directory was listed is still found."""
+        with tempfile.TemporaryDirectory() as fonts_dir:
+            self.validator.fonts_dir = Path(fonts_dir)
+            settings = {"font": "assets.fonts.newfont.ttf"}
+
+            with self.assertRaises(ValueError):
+                self.validator._validate_font("plain", settings)
+
+            (Path(fonts_dir) / "newfont.ttf").touch()
+            self.validator._validate_font("plain", settings)
+
     # Position Tests - Extended
     def test_position_validation(self):
         """Test both dictionary and tuple formats for position updates."""